@@ -0,0 +1,78 @@
+"""
+Event loop latency while validating names in an asyncio program.
+
+Run from the repository root::
+
+    python benchmarks/bench_aio.py [count]
+
+A ticker coroutine sleeps for 1 ms at a time and records how late it wakes
+up. The report shows the worst and 99th percentile lateness, and the total
+time, for inline ``FQDN(name).is_valid`` calls and for ``validate_stream``.
+
+It needs Python 3.7 or later.
+"""
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fqdn import FQDN  # noqa: E402
+from fqdn.aio import validate_stream  # noqa: E402
+
+
+async def names(count):
+    for i in range(count):
+        yield "host-{0}.zone{1}.example.com".format(i, i % 1000)
+
+
+async def inline(count):
+    async for name in names(count):
+        FQDN(name).is_valid
+
+
+async def stream(count, **kwargs):
+    async for _ in validate_stream(names(count), **kwargs):
+        pass
+
+
+async def measure(label, work):
+    lags = []
+
+    async def ticker():
+        while True:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - before - 0.001)
+
+    task = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await work
+    elapsed = time.perf_counter() - start
+    task.cancel()
+    lags.sort()
+    worst = lags[-1] if lags else elapsed
+    p99 = lags[int(len(lags) * 0.99)] if lags else elapsed
+    print(
+        "{0:<32} total {1:>7.3f}s  max lag {2:>8.2f}ms  p99 lag {3:>8.2f}ms".format(
+            label, elapsed, worst * 1e3, p99 * 1e3
+        )
+    )
+
+
+async def main(count=200000):
+    await measure("inline FQDN.is_valid", inline(count))
+    await measure("validate_stream batch=1024", stream(count))
+    await measure("validate_stream batch=256", stream(count, batch_size=256))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        await measure(
+            "validate_stream thread executor",
+            stream(count, batch_size=8192, executor=executor),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*map(int, sys.argv[1:])))
@@ -0,0 +1,63 @@
+"""
+Throughput of validate_array on NumPy and Arrow columns against
+validate_many over the same names as a list.
+
+Run from the repository root::
+
+    python benchmarks/bench_arrays.py [count]
+
+The corpora are ``short`` and ``mixed`` from ``benchmarks/corpora.py``.
+"""
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+import numpy as np  # noqa: E402
+from corpora import CORPORA  # noqa: E402
+from fqdn import validate_many  # noqa: E402
+from fqdn.arrays import validate_array  # noqa: E402
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def best(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(count=1000000):
+    for corpus in ("short", "mixed"):
+        print(corpus)
+        run(CORPORA[corpus](count))
+
+
+def run(names):
+    count = len(names)
+    columns = [
+        ("list, validate_many", names, validate_many),
+        ("numpy U", np.array(names), validate_array),
+        ("numpy S", np.array([n.encode("utf-8") for n in names]), validate_array),
+    ]
+    if pa is not None:
+        columns.append(("arrow string", pa.array(names), validate_array))
+    for label, column, func in columns:
+        elapsed = best(lambda func=func, column=column: func(column))
+        print(
+            "  {0:<20} {1:>7.1f} ns/name  {2:>6.2f}M names/s".format(
+                label, elapsed / count * 1e9, count / elapsed / 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
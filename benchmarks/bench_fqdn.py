@@ -0,0 +1,406 @@
+"""
+Benchmark suite for the fqdn package.
+
+Run from the repository root::
+
+    python benchmarks/bench_fqdn.py [-b BENCHMARK ...] [-c CORPUS ...]
+        [-s STARTUP_BENCHMARK ...] [--save results.json]
+        [--compare baseline.json]
+
+Every benchmark runs over every corpus in ``benchmarks/corpora.py``, once with
+``allow_underscores=False`` ("strict") and once with ``True`` ("underscores"),
+and reports the best time per name over a few repeats. The startup benchmarks
+(``-s``) time ``import fqdn`` and the first validation after it, with each
+engine, in fresh interpreters.
+
+``--save`` writes the results as JSON, and ``--compare`` prints the ratio to a
+saved run, marking changes larger than ``--threshold``, so that runs from two
+commits can be compared::
+
+    git checkout main && python benchmarks/bench_fqdn.py --save main.json
+    git checkout topic && python benchmarks/bench_fqdn.py --compare main.json
+"""
+import argparse
+import json
+import functools
+import os
+import platform
+import re
+import subprocess
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+import fqdn  # noqa: E402
+from corpora import CORPORA  # noqa: E402
+from fqdn import FQDN, validate_many  # noqa: E402
+from fqdn._compat import cached_property  # noqa: E402
+
+MODES = {"strict": False, "underscores": True}
+
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    """
+    Register ``func(names, allow_underscores)``, which must process every
+    name once.
+    """
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+class _LegacyFQDN(FQDN):
+    """
+    ``FQDN`` as it was before the compiled patterns were cached, for
+    comparison.
+    """
+
+    @property
+    def _regex(self):
+        regexstr = (
+            FQDN.PREFERRED_NAME_SYNTAX_REGEXSTR
+            if not self._allow_underscores
+            else FQDN.ALLOW_UNDERSCORES_REGEXSTR
+        )
+        return re.compile(regexstr, re.IGNORECASE)
+
+    @cached_property
+    def is_valid(self):
+        length = len(self._fqdn)
+        if self._fqdn.endswith("."):
+            length -= 1
+        if length > 253:
+            return False
+        if not self._regex.match(self._fqdn):
+            return False
+        return self.labels_count >= self._min_labels
+
+
+@benchmark
+def construct(names, allow_underscores):
+    for name in names:
+        FQDN(name, allow_underscores=allow_underscores)
+
+
+@benchmark
+def is_valid(names, allow_underscores):
+    for name in names:
+        FQDN(name, allow_underscores=allow_underscores).is_valid
+
+
+@benchmark
+def is_valid_fqdn(names, allow_underscores):
+    for name in names:
+        fqdn.is_valid_fqdn(name, allow_underscores=allow_underscores)
+
+
+@benchmark
+def validator_is_valid(names, allow_underscores):
+    is_valid = fqdn.Validator(allow_underscores=allow_underscores).is_valid
+    for name in names:
+        is_valid(name)
+
+
+@benchmark
+def validator_absolute_many(names, allow_underscores):
+    fqdn.Validator(allow_underscores=allow_underscores).absolute_many(names)
+
+
+@benchmark
+def is_valid_legacy(names, allow_underscores):
+    for name in names:
+        _LegacyFQDN(name, allow_underscores=allow_underscores).is_valid
+
+
+@benchmark
+def is_valid_scanner(names, allow_underscores):
+    for name in names:
+        FQDN(name, allow_underscores=allow_underscores, engine="scanner").is_valid
+
+
+@benchmark
+def validate_result(names, allow_underscores):
+    for name in names:
+        fqdn.validate(name, allow_underscores=allow_underscores)
+
+
+@benchmark
+def is_valid_cached(names, allow_underscores):
+    fqdn.enable_cache()
+    try:
+        for name in names:
+            FQDN(name, allow_underscores=allow_underscores).is_valid
+    finally:
+        fqdn.disable_cache()
+
+
+@benchmark
+def is_valid_stats(names, allow_underscores):
+    fqdn.enable_stats(sample_every=100)
+    try:
+        for name in names:
+            FQDN(name, allow_underscores=allow_underscores).is_valid
+    finally:
+        fqdn.disable_stats()
+
+
+@benchmark
+def is_valid_absolute(names, allow_underscores):
+    for name in names:
+        FQDN(name, allow_underscores=allow_underscores).is_valid_absolute
+
+
+@benchmark
+def absolute_relative(names, allow_underscores):
+    for name in names:
+        f = FQDN(name, allow_underscores=allow_underscores)
+        if f.is_valid:
+            f.absolute
+            f.relative
+
+
+@benchmark
+def hash_eq(names, allow_underscores):
+    seen = set()
+    for name in names:
+        f = FQDN(name, allow_underscores=allow_underscores)
+        if f.is_valid:
+            _ = f in seen
+            seen.add(f)
+
+
+@benchmark
+def hash_eq_deferred(names, allow_underscores):
+    seen = set()
+    for name in names:
+        f = FQDN(name, allow_underscores=allow_underscores, defer_validation=True)
+        _ = f in seen
+        seen.add(f)
+
+
+@benchmark
+def build_incremental(names, allow_underscores):
+    for name in names:
+        labels = name.rstrip(".").split(".")
+        try:
+            f = FQDN(labels.pop(), allow_underscores=allow_underscores, min_labels=1)
+            for label in reversed(labels):
+                f = f.child(label)
+        except ValueError:
+            pass
+
+
+@benchmark
+def build_revalidated(names, allow_underscores):
+    for name in names:
+        labels = name.rstrip(".").split(".")
+        f = FQDN(labels.pop(), allow_underscores=allow_underscores, min_labels=1)
+        for label in reversed(labels):
+            f = FQDN(
+                "{0}.{1}".format(label, f._fqdn),
+                allow_underscores=allow_underscores,
+                min_labels=1,
+            )
+            if not f.is_valid:
+                break
+
+
+@benchmark
+def labels_walk(names, allow_underscores):
+    for name in names:
+        f = FQDN(name, allow_underscores=allow_underscores, min_labels=1)
+        if not f.is_valid:
+            continue
+        f.tld
+        while f is not None:
+            f.labels
+            f = f.parent
+
+
+@benchmark
+def labels_walk_resplit(names, allow_underscores):
+    for name in names:
+        f = FQDN(name, allow_underscores=allow_underscores, min_labels=1)
+        if not f.is_valid:
+            continue
+        f.relative.split(".")[-1]
+        while f is not None:
+            f.relative.split(".")
+            f = f.parent
+
+
+@benchmark
+def validate_many_batch(names, allow_underscores):
+    validate_many(names, allow_underscores=allow_underscores)
+
+
+@benchmark
+def validate_many_batch_scanner(names, allow_underscores):
+    validate_many(names, allow_underscores=allow_underscores, engine="scanner")
+
+
+@benchmark
+def is_valid_bytes(names, allow_underscores):
+    for name in names:
+        fqdn.is_valid_bytes(name, allow_underscores=allow_underscores)
+
+
+STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+import fqdn
+imported = time.perf_counter()
+fqdn.FQDN("www.example.com", engine={engine!r}).is_valid
+validated = time.perf_counter()
+print(imported - start, validated - imported)
+"""
+
+STARTUP_BENCHMARKS = ("import", "first_call_regex", "first_call_scanner")
+
+
+def run_startup(benchmarks, runs=20):
+    """
+    Time ``import fqdn`` and the first validation after it in fresh
+    interpreters, and return ``{"startup/name": ns}`` with the best of
+    ``runs`` for each.
+    """
+    env = dict(os.environ)
+    # time loading cached bytecode, as an installed package would
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    timings = {}
+    for engine in ("regex", "scanner"):
+        script = STARTUP_SCRIPT.format(engine=engine)
+        samples = []
+        for _ in range(runs + 1):
+            output = subprocess.check_output(
+                [sys.executable, "-c", script], cwd=os.path.join(HERE, ".."), env=env
+            )
+            samples.append([float(t) for t in output.split()])
+        # the first run may have written the bytecode
+        samples = samples[1:]
+        timings.setdefault("import", []).extend(s[0] for s in samples)
+        timings["first_call_" + engine] = [s[1] for s in samples]
+
+    results = {}
+    for name in benchmarks:
+        key = "startup/{0}".format(name)
+        results[key] = min(timings[name]) * 1e9
+        print("{0:<48} {1:>10.1f} us".format(key, results[key] / 1e3))
+    return results
+
+
+def _corpus_for(benchmark_name, names):
+    if benchmark_name == "is_valid_bytes":
+        return [name.encode("utf-8") for name in names]
+    return names
+
+
+def run(benchmarks, corpora, number=3, repeat=5):
+    """
+    Run every combination and return ``{"benchmark/corpus/mode": ns_per_name}``.
+    """
+    results = {}
+    for corpus_name in corpora:
+        names = CORPORA[corpus_name]()
+        for benchmark_name in benchmarks:
+            func = BENCHMARKS[benchmark_name]
+            corpus = _corpus_for(benchmark_name, names)
+            for mode, allow_underscores in sorted(MODES.items()):
+                best = min(
+                    timeit.repeat(
+                        functools.partial(func, corpus, allow_underscores),
+                        number=number,
+                        repeat=repeat,
+                    )
+                )
+                key = "{0}/{1}/{2}".format(benchmark_name, corpus_name, mode)
+                results[key] = best / number / len(corpus) * 1e9
+                print("{0:<48} {1:>10.1f} ns/name".format(key, results[key]))
+    return results
+
+
+def _commit():
+    try:
+        output = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=HERE,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode("ascii").strip()
+
+
+def compare(results, baseline, threshold):
+    """
+    Print the ratio of each result to the baseline and return the keys that
+    got slower by more than ``threshold``.
+    """
+    regressions = []
+    print()
+    print("compared with {0}".format(baseline.get("commit") or "baseline"))
+    for key in sorted(results):
+        before = baseline["results"].get(key)
+        if not before:
+            continue
+        ratio = results[key] / before
+        mark = ""
+        if ratio > 1 + threshold:
+            mark = "  slower"
+            regressions.append(key)
+        elif ratio < 1 - threshold:
+            mark = "  faster"
+        print("{0:<48} {1:>8.2f}x{2}".format(key, ratio, mark))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite for fqdn.")
+    parser.add_argument(
+        "-b", "--benchmark", action="append", choices=sorted(BENCHMARKS)
+    )
+    parser.add_argument("-c", "--corpus", action="append", choices=sorted(CORPORA))
+    parser.add_argument("-s", "--startup", action="append", choices=STARTUP_BENCHMARKS)
+    parser.add_argument("--save", metavar="FILE", help="write results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="compare with saved JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative change reported by --compare (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    if args.benchmark or args.corpus or not args.startup:
+        results.update(
+            run(args.benchmark or sorted(BENCHMARKS), args.corpus or list(CORPORA))
+        )
+    if args.startup or not (args.benchmark or args.corpus):
+        results.update(run_startup(args.startup or STARTUP_BENCHMARKS))
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {
+                    "commit": _commit(),
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
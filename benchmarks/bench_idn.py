@@ -0,0 +1,52 @@
+"""
+Throughput of IDNConverter against encoding each name with the standard
+library ``idna`` codec and then building an ``FQDN`` from the result, on
+corpora of short names with increasing shares of internationalized ones. Run
+from the repository root::
+
+    python benchmarks/bench_idn.py [names]
+"""
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from corpora import idn  # noqa: E402
+from fqdn import FQDN  # noqa: E402
+from fqdn.idn import IDNConverter  # noqa: E402
+
+
+def codec_then_fqdn(names):
+    results = []
+    for name in names:
+        try:
+            f = FQDN(name.encode("idna").decode("ascii"))
+        except UnicodeError:
+            results.append(None)
+            continue
+        results.append(f.absolute if f.is_valid else None)
+    return results
+
+
+def converter(names):
+    return list(IDNConverter().map(names))
+
+
+def main(size=100000):
+    for idn_rate in (0.0, 0.1, 0.5, 1.0):
+        names = idn(size, idn_rate=idn_rate)
+        for func in (codec_then_fqdn, converter):
+            start = time.perf_counter()
+            func(names)
+            elapsed = time.perf_counter() - start
+            print(
+                "{0:>4.0%} IDN {1:<16} {2:>9.0f} names/s".format(
+                    idn_rate, func.__name__, size / elapsed
+                )
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
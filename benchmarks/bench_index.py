@@ -0,0 +1,51 @@
+"""
+Bulk load, memory and lookup cost of SuffixIndex against a set of FQDN.
+
+Run from the repository root::
+
+    python benchmarks/bench_index.py [count]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fqdn import FQDN  # noqa: E402
+from fqdn.index import SuffixIndex  # noqa: E402
+
+
+def main(count=1000000):
+    names = ["host-{0}.zone{1}.example.com".format(i, i % 1000) for i in range(count)]
+    queries = ["www.{0}".format(name) for name in names[:100000]]
+
+    for label, build, lookup in (
+        ("set of FQDN", set, lambda index, name: FQDN(name) in index),
+        (
+            "SuffixIndex",
+            SuffixIndex,
+            lambda index, name: index.longest_match(name) is not None,
+        ),
+    ):
+        items = map(FQDN, names) if build is set else names
+        tracemalloc.start()
+        start = time.perf_counter()
+        index = build(items)
+        load = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for query in queries:
+            lookup(index, query)
+        per_lookup = (time.perf_counter() - start) / len(queries)
+        print(
+            "{0:<14} load {1:>6.2f}s  {2:>6.1f} bytes/name  lookup {3:>7.0f} ns".format(
+                label, load, memory / float(count), per_lookup * 1e9
+            )
+        )
+        del index
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""
+Per-instance memory of FQDN and CompactFQDN.
+
+Run from the repository root::
+
+    python benchmarks/bench_memory.py
+
+Each figure is the traced allocation for ``COUNT`` distinct instances, divided
+by ``COUNT``, after ``is_valid`` and ``absolute`` have been read. It excludes
+the input strings but includes the normalized strings each object keeps.
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fqdn import FQDN, CompactFQDN, InternTable  # noqa: E402
+
+COUNT = 100000
+
+
+def measure(factory, names):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = []
+    for name in names:
+        obj = factory(name)
+        obj.is_valid
+        obj.absolute
+        objects.append(obj)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding the objects is not part of their cost
+    return (after - before - sys.getsizeof(objects)) / float(len(names))
+
+
+def main():
+    names = ["host-{0}.example.com".format(i) for i in range(COUNT)]
+    print("{0:<28} {1:>8.1f} bytes".format("FQDN", measure(FQDN, names)))
+    print("{0:<28} {1:>8.1f} bytes".format("CompactFQDN", measure(CompactFQDN, names)))
+    repeated = names[: COUNT // 10] * 10
+    table = InternTable(maxsize=COUNT)
+    print(
+        "{0:<28} {1:>8.1f} bytes".format(
+            "InternTable, 10x repeats", measure(table, repeated)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Throughput of Normalizer on a skewed log sample against FQDN(name).absolute
+for every record, with and without the validation cache.
+
+The sample draws hostnames from a Zipf-like distribution over a few thousand
+names, each written in a random case and with or without a trailing dot, as
+they appear in logs. Run from the repository root::
+
+    python benchmarks/bench_normalize.py [records] [hosts]
+"""
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+import fqdn  # noqa: E402
+from corpora import short  # noqa: E402
+from fqdn import FQDN  # noqa: E402
+from fqdn.normalize import Normalizer  # noqa: E402
+
+
+def log_sample(records, hosts, seed=5):
+    rng = random.Random(seed)
+    names = short(hosts, seed)
+    weights = [1.0 / rank for rank in range(1, hosts + 1)]
+    sample = []
+    for name in rng.choices(names, weights, k=records):
+        if rng.random() < 0.2:
+            name = name.upper()
+        if rng.random() < 0.2:
+            name = name.rstrip(".") + "."
+        sample.append(name)
+    return sample
+
+
+def per_object(sample):
+    results = []
+    for name in sample:
+        f = FQDN(name)
+        results.append(f.absolute if f.is_valid else None)
+    return results
+
+
+def per_object_cached(sample):
+    fqdn.enable_cache()
+    try:
+        return per_object(sample)
+    finally:
+        fqdn.disable_cache()
+
+
+def normalizer_map(sample):
+    return list(Normalizer().map(sample))
+
+
+def normalizer_unique(sample):
+    return list(Normalizer().unique(sample))
+
+
+def main(records=1000000, hosts=5000):
+    sample = log_sample(records, hosts)
+    print("{0} records, {1} distinct raw names".format(records, len(set(sample))))
+    for func in (per_object, per_object_cached, normalizer_map, normalizer_unique):
+        start = time.perf_counter()
+        func(sample)
+        elapsed = time.perf_counter() - start
+        print(
+            "{0:<20} {1:>7.1f} ns/record".format(func.__name__, elapsed / records * 1e9)
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
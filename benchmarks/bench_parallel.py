@@ -0,0 +1,48 @@
+"""
+Throughput of validate_parallel against a single-process validate_many.
+
+Run from the repository root::
+
+    python benchmarks/bench_parallel.py [count] [max_workers]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fqdn import validate_many  # noqa: E402
+from fqdn.parallel import validate_parallel  # noqa: E402
+
+
+def names(count):
+    for i in range(count):
+        yield "host-{0}.zone{1}.example.com".format(i, i % 1000)
+
+
+def report(label, count, elapsed):
+    print("{0:<28} {1:>12.0f} names/s".format(label, count / elapsed))
+
+
+def main(count=2000000, max_workers=None):
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    start = time.perf_counter()
+    validate_many(names(count))
+    report("validate_many", count, time.perf_counter() - start)
+
+    workers = 1
+    while workers <= max_workers:
+        for ordered in (True, False):
+            start = time.perf_counter()
+            for _ in validate_parallel(names(count), workers=workers, ordered=ordered):
+                pass
+            label = "workers={0} {1}".format(
+                workers, "ordered" if ordered else "unordered"
+            )
+            report(label, count, time.perf_counter() - start)
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,80 @@
+"""
+Load time of the Public Suffix List, parsed and from a saved index, and the
+cost of registrable domain lookups against splitting names by hand over a
+linear list of suffixes.
+
+Run from the repository root, with a local copy of the list::
+
+    python benchmarks/bench_psl.py [path/to/public_suffix_list.dat]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from corpora import short  # noqa: E402
+from fqdn.psl import PublicSuffixList  # noqa: E402
+
+SYSTEM_LIST = "/usr/share/publicsuffix/public_suffix_list.dat"
+
+
+def timed(func, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def linear_registrable_domain(suffixes, name):
+    # what consumers wrote by hand: the longest listed suffix by scanning
+    # the whole list, ignoring wildcard and exception rules
+    name = name.lower().rstrip(".")
+    best = name[name.rfind(".") + 1 :]
+    for suffix in suffixes:
+        if len(suffix) > len(best) and name.endswith("." + suffix):
+            best = suffix
+    labels = name[: -len(best) - 1].split(".")
+    return "{0}.{1}".format(labels[-1], best) if labels[-1] else None
+
+
+def main(path=SYSTEM_LIST):
+    load, psl = timed(lambda: PublicSuffixList.from_file(path))
+    print("parse list           {0:>8.1f} ms".format(load * 1e3))
+    with tempfile.TemporaryDirectory() as directory:
+        cache = os.path.join(directory, "psl.json")
+        PublicSuffixList.from_file(path, cache=cache)
+        load, _ = timed(lambda: PublicSuffixList.from_file(path, cache=cache))
+        print("load saved index     {0:>8.1f} ms".format(load * 1e3))
+
+    names = short(100000)
+    elapsed, _ = timed(lambda: [psl.registrable_domain(name) for name in names])
+    print("registrable_domain   {0:>8.0f} ns/name".format(elapsed / len(names) * 1e9))
+    elapsed, _ = timed(lambda: psl.registrable_domains(names))
+    print("registrable_domains  {0:>8.0f} ns/name".format(elapsed / len(names) * 1e9))
+    rng = random.Random(0)
+    repeated = [rng.choice(names[:2000]) for _ in names]
+    elapsed, _ = timed(lambda: psl.registrable_domains(repeated))
+    print("  2000 distinct      {0:>8.0f} ns/name".format(elapsed / len(names) * 1e9))
+
+    with open(path, encoding="utf-8") as f:
+        suffixes = [
+            line.strip()
+            for line in f
+            if line.strip() and not line.startswith("//") and line[0] not in "*!"
+        ]
+    sample = names[:200]
+    elapsed, _ = timed(
+        lambda: [linear_registrable_domain(suffixes, name) for name in sample], 1
+    )
+    print("linear suffix scan   {0:>8.0f} ns/name".format(elapsed / len(sample) * 1e9))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
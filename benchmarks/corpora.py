@@ -0,0 +1,144 @@
+# coding=utf-8
+"""
+Deterministic name corpora for the benchmarks.
+
+Every corpus is a list of ``str`` built from a fixed seed, so results from
+different commits measure the same input.
+"""
+import random
+
+SIZE = 1000
+
+
+def _label(rng, alphabet, size):
+    return "".join(rng.choice(alphabet) for _ in range(size))
+
+
+def short(size=SIZE, seed=0):
+    """
+    Typical hostnames: two to four short labels, some absolute, mixed case.
+    """
+    rng = random.Random(seed)
+    tlds = ("com", "net", "org", "co.uk", "io", "DE")
+    names = []
+    for _ in range(size):
+        labels = [
+            _label(
+                rng, "abcdefghijklmnopqrstuvwxyz0123456789-", rng.randint(3, 12)
+            ).strip("-")
+            or "x"
+            for _ in range(rng.randint(1, 3))
+        ]
+        name = ".".join(labels + [rng.choice(tlds)])
+        if rng.random() < 0.3:
+            name = name.upper()
+        if rng.random() < 0.3:
+            name += "."
+        names.append(name)
+    return names
+
+
+def max_length(size=SIZE, seed=1):
+    """
+    Valid names of exactly 253 bytes, in four labels of up to 63 bytes.
+    """
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789"
+    return [
+        ".".join(_label(rng, alphabet, n) for n in (63, 63, 63, 61))
+        for _ in range(size)
+    ]
+
+
+def many_labels(size=SIZE, seed=2):
+    """
+    Valid names of 127 one-byte labels, the most a 253 byte name can hold.
+    """
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789"
+    return [".".join(rng.choice(alphabet) for _ in range(127)) for _ in range(size)]
+
+
+def hyphens(size=SIZE, seed=3):
+    """
+    Adversarial hyphen-heavy names: long runs of hyphens inside labels, and
+    labels that end in a hyphen near the end of the name so that the regex
+    engine backtracks through every label before rejecting it.
+    """
+    rng = random.Random(seed)
+    names = []
+    for i in range(size):
+        labels = ["a" + "-" * rng.randint(10, 50) + "b" for _ in range(4)]
+        if i % 2:
+            labels[-1] = labels[-1][:-1]
+        names.append(".".join(labels))
+    return names
+
+
+def mixed(size=SIZE, seed=4, invalid_rate=0.3):
+    """
+    ``short`` names with ``invalid_rate`` of them replaced by typical garbage:
+    URLs, whitespace, empty labels, non-ASCII, underscores and overlong input.
+    """
+    rng = random.Random(seed)
+    garbage = (
+        lambda name: "https://{0}/index.html".format(name),
+        lambda name: " {0}".format(name),
+        lambda name: name.replace(".", "..", 1),
+        lambda name: "-" + name,
+        lambda name: "é" + name,
+        lambda name: "_dmarc." + name,
+        lambda name: ".".join([name] * 20),
+    )
+    names = short(size, seed)
+    for i in range(size):
+        if rng.random() < invalid_rate:
+            names[i] = rng.choice(garbage)(names[i])
+    return names
+
+
+def mixed_10(size=SIZE):
+    """
+    ``mixed`` with 10% invalid names.
+    """
+    return mixed(size, invalid_rate=0.1)
+
+
+def mixed_50(size=SIZE):
+    """
+    ``mixed`` with 50% invalid names.
+    """
+    return mixed(size, invalid_rate=0.5)
+
+
+def idn(size=SIZE, seed=6, idn_rate=0.3):
+    """
+    ``short`` names with ``idn_rate`` of them internationalized: a label
+    replaced by one of a few U-labels, or the suffix by a Unicode TLD. The
+    U-labels repeat across names, as they do in real traffic. They are only
+    text on Python 3, which ``fqdn.idn`` needs too.
+    """
+    rng = random.Random(seed)
+    u_labels = ("bücher", "münchen", "пример", "例え", "café", "straße", "δοκιμή")
+    u_tlds = ("рф", "テスト", "中国", "ελ")
+    names = short(size, seed)
+    for i in range(size):
+        if rng.random() < idn_rate:
+            labels = names[i].split(".")
+            if rng.random() < 0.5:
+                labels[0] = rng.choice(u_labels)
+            else:
+                labels[-2 if labels[-1] == "" else -1] = rng.choice(u_tlds)
+            names[i] = ".".join(labels)
+    return names
+
+
+CORPORA = {
+    "short": short,
+    "max_length": max_length,
+    "many_labels": many_labels,
+    "hyphens": hyphens,
+    "mixed": mixed,
+    "mixed_10": mixed_10,
+    "mixed_50": mixed_50,
+}
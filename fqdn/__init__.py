@@ -1,9 +1,15 @@
-import re
+from fqdn import _scanner
+from fqdn._scanner import VALID, ValidationResult  # noqa: F401
+from fqdn._compat import cached_property, move_to_end, str_isascii
 
-from fqdn._compat import cached_property
+_REGEX_CACHE = {}
+_DEFAULT_ENGINE = "regex"
+_validation_cache = None
+_enabled_stats = None
+_BOUND_ENGINES = {}
 
 
-class FQDN:
+class FQDN(object):
     """
     From https://tools.ietf.org/html/rfc1035#page-9,  RFC 1035 3.1. Name space
     definitions:
@@ -27,24 +33,51 @@ class FQDN:
     """
 
     PREFERRED_NAME_SYNTAX_REGEXSTR = (
-        r"^((?![-])[-A-Z\d]{1,63}(?<!-)[.])*(?!-)[-A-Z\d]{1,63}(?<!-)[.]?$"
+        r"^((?![-])[-A-Z\d]{1,63}(?<!-)[.])*(?!-)[-A-Z\d]{1,63}(?<!-)[.]?\Z"
     )
     ALLOW_UNDERSCORES_REGEXSTR = (
-        r"^((?![-])[-_A-Z\d]{1,63}(?<!-)[.])*(?!-)[-_A-Z\d]{1,63}(?<!-)[.]?$"
+        r"^((?![-])[-_A-Z\d]{1,63}(?<!-)[.])*(?!-)[-_A-Z\d]{1,63}(?<!-)[.]?\Z"
     )
 
     def __init__(self, fqdn, *nothing, **kwargs):
         if nothing:
             raise ValueError("got extra positional parameter, try kwargs")
-        unknown_kwargs = set(kwargs.keys()) - {"allow_underscores", "min_labels"}
+        unknown_kwargs = set(kwargs.keys()) - {
+            "allow_underscores",
+            "min_labels",
+            "engine",
+            "defer_validation",
+        }
         if unknown_kwargs:
             raise ValueError("got extra kwargs: {}".format(unknown_kwargs))
 
         if not (fqdn and isinstance(fqdn, str)):
             raise ValueError("fqdn must be str")
-        self._fqdn = fqdn.lower()
         self._allow_underscores = kwargs.get("allow_underscores", False)
         self._min_labels = kwargs.get("min_labels", 2)
+        self._engine = _engine(kwargs.get("engine"))
+
+        cache = _validation_cache
+        if cache is None:
+            self._fqdn = fqdn.lower()
+        else:
+            self._fqdn, is_valid, absolute, relative = cache.lookup(
+                fqdn, self._allow_underscores, self._min_labels, self._engine
+            )
+            # seed the cached properties, which read the instance __dict__
+            # first
+            self.__dict__["is_valid"] = is_valid
+            if is_valid:
+                self.__dict__["absolute"] = absolute
+                self.__dict__["relative"] = relative
+
+        # the key __hash__ and __eq__ use instead of `absolute` when
+        # validation is deferred; equal to `absolute` for a valid FQDN
+        self._key = None
+        if kwargs.get("defer_validation", False):
+            self._key = (
+                self._fqdn if self._fqdn.endswith(".") else "{0}.".format(self._fqdn)
+            )
 
     def __str__(self):
         """
@@ -54,12 +87,7 @@ class FQDN:
 
     @property
     def _regex(self):
-        regexstr = (
-            FQDN.PREFERRED_NAME_SYNTAX_REGEXSTR
-            if not self._allow_underscores
-            else FQDN.ALLOW_UNDERSCORES_REGEXSTR
-        )
-        return re.compile(regexstr, re.IGNORECASE)
+        return _compiled_regex(self._allow_underscores, self._min_labels)
 
     @cached_property
     def is_valid(self):
@@ -74,24 +102,63 @@ class FQDN:
         If and only if the FQDN ends with a dot (in place of the RFC1035
         trailing null byte), it may have a total length of 254 bytes, still it
         must be less than 253 bytes.
+
+        The ``engine`` constructor option selects how this is decided:
+        ``"regex"`` (the default) matches the ``PREFERRED_NAME_SYNTAX_REGEXSTR``
+        or ``ALLOW_UNDERSCORES_REGEXSTR`` pattern, and ``"scanner"`` checks the
+        labels without regular expressions in time linear in the length of the
+        name. Both engines give the same result for every input.
         """
-        length = len(self._fqdn)
-        if self._fqdn.endswith("."):
-            length -= 1
-        if length > 253:
-            return False
-        regex_pass = self._regex.match(self._fqdn)
-        if not regex_pass:
-            return False
+        return self._engine(self._fqdn, self._allow_underscores, self._min_labels)
 
-        return self.labels_count >= self._min_labels
+    @cached_property
+    def validation_result(self):
+        """
+        Why the name is valid or not, as a ``ValidationResult``: ``VALID`` for
+        a valid name, otherwise the reason ``code`` with the index of the
+        offending ``label`` and the ``offset`` of the offending character in
+        the lowercased name. It agrees with ``is_valid`` whichever engine is
+        used.
+        """
+        return _scanner.check(self._fqdn, self._allow_underscores, self._min_labels)
 
-    @property
+    @cached_property
     def labels_count(self):
         has_terminal_dot = self._fqdn[-1] == "."
         count = self._fqdn.count(".") + (0 if has_terminal_dot else 1)
         return count
 
+    @cached_property
+    def labels(self):
+        """
+        The labels of the FQDN as a tuple of lowercase strings, from the
+        leftmost one to the top-level domain. ``tld`` and ``depth`` are read
+        from it, and ``parent`` and ``child`` pass it on, so a name is split
+        at most once.
+
+        Raises ``ValueError`` if the FQDN is invalid.
+
+        >>> FQDN('www.BBC.co.uk.').labels
+        ('www', 'bbc', 'co', 'uk')
+        """
+        return tuple(self.relative.split("."))
+
+    @cached_property
+    def tld(self):
+        """
+        The last label, the top-level domain. Raises ``ValueError`` if the
+        FQDN is invalid.
+        """
+        return self.labels[-1]
+
+    @cached_property
+    def depth(self):
+        """
+        The number of labels, like ``labels_count``, but raising
+        ``ValueError`` if the FQDN is invalid.
+        """
+        return len(self.labels)
+
     @cached_property
     def is_valid_absolute(self):
         """
@@ -137,9 +204,704 @@ class FQDN:
 
         return self._fqdn
 
+    def _derived(self, fqdn, is_valid, labels=None):
+        """
+        A new instance for ``fqdn``, already lowercased, with the same options
+        and ``is_valid`` known in advance rather than validated, and its
+        ``labels`` when they are known.
+        """
+        cls = type(self)
+        derived = cls.__new__(cls)
+        derived._fqdn = fqdn
+        derived._allow_underscores = self._allow_underscores
+        derived._min_labels = self._min_labels
+        derived._engine = self._engine
+        derived._key = None
+        derived.__dict__["is_valid"] = is_valid
+        if is_valid and labels is not None:
+            derived.__dict__["labels"] = labels
+        if self._key is not None:
+            derived._key = fqdn if fqdn.endswith(".") else "{0}.".format(fqdn)
+        return derived
+
+    def child(self, label):
+        """
+        The FQDN for ``label`` prepended to this one, with the same options,
+        and absolute if this one is.
+
+        This FQDN must be valid, and only the new label and the total length
+        are checked, so names can be built one label at a time without
+        validating the whole name again at every step. Raises ``ValueError``
+        if this FQDN or the result would be invalid.
+
+        >>> FQDN('example.com.').child('WWW').absolute
+        'www.example.com.'
+        """
+        if not self.is_valid:
+            raise ValueError("invalid FQDN `{0}`".format(self._fqdn))
+        if not (label and isinstance(label, str)):
+            raise ValueError("label must be str")
+        label = label.lower()
+        if not _scanner.is_valid_label(label, self._allow_underscores):
+            raise ValueError("invalid label `{0}`".format(label))
+        # the child has one more label than this name, so it cannot have
+        # fewer than min_labels; only the length limit needs checking
+        if len(label) + 1 + len(self.relative) > 253:
+            raise ValueError(
+                "invalid FQDN `{0}.{1}`: too long".format(label, self._fqdn)
+            )
+        labels = self.__dict__.get("labels")
+        if labels is not None:
+            labels = (label,) + labels
+        return self._derived("{0}.{1}".format(label, self._fqdn), True, labels)
+
+    @cached_property
+    def parent(self):
+        """
+        The FQDN with the first label removed, with the same options, or None
+        for a single label. It is valid unless it has fewer than
+        ``min_labels`` labels, and is not validated again.
+
+        Raises ``ValueError`` if this FQDN is invalid.
+
+        >>> FQDN('www.example.com').parent.relative
+        'example.com'
+        >>> FQDN('example.com').parent.is_valid
+        False
+        """
+        if not self.is_valid:
+            raise ValueError("invalid FQDN `{0}`".format(self._fqdn))
+        parent = self._fqdn.partition(".")[2]
+        if not parent:
+            return None
+        labels = self.__dict__.get("labels")
+        if labels is not None:
+            labels = labels[1:]
+        return self._derived(parent, self.labels_count - 1 >= self._min_labels, labels)
+
     def __eq__(self, other):
-        if isinstance(other, FQDN):
-            return self.absolute == other.absolute
+        """
+        Equal to an FQDN with the same absolute form. Without the
+        ``defer_validation`` option this validates the name, raising
+        ``ValueError`` if it is invalid. With it, the lowercased name with a
+        trailing dot, taken in the constructor, is compared instead and the
+        name is not validated.
+        """
+        if isinstance(other, (FQDN, CompactFQDN)):
+            return (self._key or self.absolute) == (other._key or other.absolute)
 
     def __hash__(self):
-        return hash(self.absolute) + hash("fqdn")
+        return hash(self._key or self.absolute) + hash("fqdn")
+
+
+class CacheInfo(tuple):
+    """
+    ``(hits, misses, evictions, maxsize, currsize)``, as returned by
+    ``ValidationCache.info``. It reads like a named tuple, but is a plain
+    ``tuple`` subclass, so that importing the package does not import
+    collections.
+    """
+
+    __slots__ = ()
+
+    _fields = ("hits", "misses", "evictions", "maxsize", "currsize")
+
+    def __new__(cls, hits, misses, evictions, maxsize, currsize):
+        return tuple.__new__(cls, (hits, misses, evictions, maxsize, currsize))
+
+    hits = property(lambda self: self[0])
+    misses = property(lambda self: self[1])
+    evictions = property(lambda self: self[2])
+    maxsize = property(lambda self: self[3])
+    currsize = property(lambda self: self[4])
+
+    def __repr__(self):
+        return "CacheInfo({0})".format(
+            ", ".join(
+                "{0}={1!r}".format(field, value)
+                for field, value in zip(self._fields, self)
+            )
+        )
+
+
+class ValidationCache:
+    """
+    A process-wide memo of ``FQDN`` validation and normalization, keyed on
+    the string passed to the constructor and its ``allow_underscores`` and
+    ``min_labels`` options.
+
+    Install one with ``enable_cache``. While it is installed, an ``FQDN``
+    whose key is cached neither lowercases its input nor validates it, and
+    reads ``is_valid``, ``absolute`` and ``relative`` from the cache.
+
+    At most ``maxsize`` entries are kept. Past that, the ``"lru"`` policy
+    evicts the least recently used entry and ``"fifo"`` evicts the oldest
+    one. The ``hits``, ``misses`` and ``evictions`` counters are best effort
+    when several threads share the cache.
+    """
+
+    POLICIES = ("lru", "fifo")
+
+    def __init__(self, maxsize=65536, policy="lru"):
+        if policy not in self.POLICIES:
+            raise ValueError(
+                "policy must be one of {0}, got {1!r}".format(self.POLICIES, policy)
+            )
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = self.misses = self.evictions = 0
+        self._lru = policy == "lru"
+        from collections import OrderedDict
+
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, fqdn, allow_underscores, min_labels, engine):
+        """
+        The ``(lowercased, is_valid, absolute, relative)`` entry for a
+        constructor argument, where ``engine`` is the validation function to
+        run on a miss. ``absolute`` and ``relative`` are None when invalid.
+        """
+        key = (fqdn, allow_underscores, min_labels)
+        entries = self._entries
+        entry = entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            if self._lru:
+                try:
+                    move_to_end(entries, key)
+                except KeyError:
+                    # evicted by another thread since the get
+                    pass
+            return entry
+
+        self.misses += 1
+        lowered = fqdn.lower()
+        stats = _enabled_stats
+        if stats is None:
+            is_valid = engine(lowered, allow_underscores, min_labels)
+        else:
+            is_valid = stats.validate(engine, lowered, allow_underscores, min_labels)
+        if is_valid:
+            if lowered.endswith("."):
+                entry = (lowered, True, lowered, lowered[:-1])
+            else:
+                entry = (lowered, True, "{0}.".format(lowered), lowered)
+        else:
+            entry = (lowered, False, None, None)
+        entries[key] = entry
+        if len(entries) > self.maxsize:
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                pass
+            else:
+                self.evictions += 1
+        return entry
+
+    def info(self):
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._entries)
+        )
+
+    def clear(self):
+        """
+        Drop all entries and reset the counters.
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+def enable_cache(maxsize=65536, policy="lru"):
+    """
+    Install a new process-wide ``ValidationCache`` for ``FQDN`` and return
+    it. Any cache installed before is replaced.
+    """
+    global _validation_cache
+    _validation_cache = ValidationCache(maxsize=maxsize, policy=policy)
+    return _validation_cache
+
+
+def disable_cache():
+    """
+    Remove the process-wide ``ValidationCache``, returning it or None.
+    """
+    global _validation_cache
+    cache, _validation_cache = _validation_cache, None
+    return cache
+
+
+def enable_stats(sample_every=0, callback=None):
+    """
+    Start counting ``FQDN`` constructions, validations, rejections by
+    reason and cached property hits, timing one in every ``sample_every``
+    operations, and return the ``Stats`` that records them. Any ``Stats``
+    enabled before is replaced. ``callback(metric, value)`` is called for
+    every update, to forward them to a metrics system.
+
+    Disabled, which is the default, statistics cost nothing: enabling them
+    installs counting wrappers on the ``FQDN`` class, and disabling them
+    removes the wrappers.
+    """
+    global _enabled_stats
+    from fqdn._stats import Stats
+
+    # built first, so that invalid arguments leave the current stats running
+    stats = Stats(sample_every=sample_every, callback=callback)
+    disable_stats()
+    stats.install(FQDN)
+    _enabled_stats = stats
+    return stats
+
+
+def disable_stats():
+    """
+    Stop recording statistics, returning the ``Stats`` that was enabled or
+    None.
+    """
+    global _enabled_stats
+    stats, _enabled_stats = _enabled_stats, None
+    if stats is not None:
+        stats.uninstall(FQDN)
+    return stats
+
+
+class CompactFQDN(object):
+    """
+    A validated FQDN that keeps only its canonical absolute form.
+
+    The name is validated and normalized once, in the constructor, which
+    raises ``ValueError`` for an invalid name. Instances have no ``__dict__``,
+    so they take a fraction of the memory of an ``FQDN`` when millions are
+    held at once. They compare and hash equal to an ``FQDN`` for the same
+    name.
+
+    Use an ``InternTable`` to share one instance between equal names.
+    """
+
+    __slots__ = ("_absolute",)
+
+    def __init__(self, fqdn, allow_underscores=False, min_labels=2, engine=None):
+        if not (fqdn and isinstance(fqdn, str)):
+            raise ValueError("fqdn must be str")
+        fqdn = fqdn.lower()
+        if not _engine(engine)(fqdn, allow_underscores, min_labels):
+            raise ValueError("invalid FQDN `{0}`".format(fqdn))
+        self._absolute = fqdn if fqdn.endswith(".") else "{0}.".format(fqdn)
+
+    def __str__(self):
+        """
+        The FQDN as a string in absolute form
+        """
+        return self._absolute
+
+    @property
+    def is_valid(self):
+        """
+        Always True, as invalid names are rejected by the constructor.
+        """
+        return True
+
+    @property
+    def absolute(self):
+        """
+        The FQDN as a string in absolute form
+        """
+        return self._absolute
+
+    @property
+    def relative(self):
+        """
+        The FQDN as a string in relative form
+        """
+        return self._absolute[:-1]
+
+    @property
+    def labels_count(self):
+        return self._absolute.count(".")
+
+    @property
+    def _key(self):
+        return self._absolute
+
+    def __eq__(self, other):
+        if isinstance(other, (FQDN, CompactFQDN)):
+            return self._absolute == (other._key or other.absolute)
+
+    def __hash__(self):
+        return hash(self._absolute) + hash("fqdn")
+
+
+class InternTable:
+    """
+    Builds ``CompactFQDN`` instances so that equal names share one object.
+
+    Instances are keyed on their absolute form and the table holds at most
+    ``maxsize`` of them, dropping the least recently used first. Every name
+    is validated with the options given here, so a name already in the table
+    is returned without being validated again.
+
+    >>> table = InternTable(maxsize=1024)
+    >>> table('BBC.co.uk') is table('bbc.co.uk.')
+    True
+    """
+
+    def __init__(self, maxsize=65536, allow_underscores=False, min_labels=2):
+        self.maxsize = maxsize
+        self._allow_underscores = allow_underscores
+        self._min_labels = min_labels
+        from collections import OrderedDict
+
+        self._table = OrderedDict()
+
+    def __len__(self):
+        return len(self._table)
+
+    def __call__(self, fqdn):
+        if not (fqdn and isinstance(fqdn, str)):
+            raise ValueError("fqdn must be str")
+        key = fqdn.lower()
+        if not key.endswith("."):
+            key = "{0}.".format(key)
+        table = self._table
+        try:
+            interned = table[key]
+        except KeyError:
+            interned = CompactFQDN(
+                fqdn,
+                allow_underscores=self._allow_underscores,
+                min_labels=self._min_labels,
+            )
+            table[key] = interned
+            if len(table) > self.maxsize:
+                table.popitem(last=False)
+        else:
+            move_to_end(table, key)
+        return interned
+
+    def clear(self):
+        self._table.clear()
+
+
+def _compiled_regex(allow_underscores, min_labels, binary=False):
+    """
+    The preferred name syntax regex for one combination of constructor
+    options, compiled on first use and then held in a module level cache.
+
+    ``min_labels`` is folded into the pattern as the minimum repetition of the
+    leading ``label.`` group, so a match also satisfies the label count.
+
+    With ``binary`` the pattern matches bytes-like objects instead of ``str``.
+    It has no leading ``^``, which never matches past the start of a buffer,
+    so that ``match(buffer, pos, endpos)`` can check a name inside a larger
+    buffer in place.
+    """
+    if not min_labels <= 128:
+        # a name of at most 253 bytes has at most 127 labels, so this matches
+        # nothing, as a larger min_labels would, and keeps the repetition
+        # small enough to compile; infinity and NaN land here as well
+        min_labels = 128
+    elif not isinstance(min_labels, int):
+        # a label count is whole, so it is at least min_labels exactly when it
+        # is at least the ceiling; this also keeps a float such as 2.0, which
+        # compares and hashes equal to 2, from caching a pattern under its key
+        import math
+
+        min_labels = int(math.ceil(min_labels))
+    key = (bool(allow_underscores), min_labels, binary)
+    try:
+        return _REGEX_CACHE[key]
+    except KeyError:
+        pass
+    regexstr = (
+        FQDN.PREFERRED_NAME_SYNTAX_REGEXSTR
+        if not allow_underscores
+        else FQDN.ALLOW_UNDERSCORES_REGEXSTR
+    )
+    if min_labels > 1:
+        regexstr = regexstr.replace(")*", "){{{0},}}".format(min_labels - 1), 1)
+    if binary:
+        regexstr = regexstr[1:].encode("ascii")
+    # imported here rather than at the top, as importing re is most of the
+    # cost of importing this package
+    import re
+
+    # re.ASCII is Python 3 only; on Python 2 str patterns match ASCII anyway
+    flags = re.IGNORECASE | getattr(re, "ASCII", 0)
+    regex = _REGEX_CACHE[key] = re.compile(regexstr, flags)
+    return regex
+
+
+def _regex_is_valid(fqdn, allow_underscores=False, min_labels=2):
+    length = len(fqdn)
+    if fqdn.endswith("."):
+        length -= 1
+    if length > 253:
+        return False
+    # the preferred name syntax is ASCII, and str.isascii answers in constant
+    # time where the regex would scan up to the first non-ASCII character
+    if not str_isascii(fqdn):
+        return False
+    return _compiled_regex(allow_underscores, min_labels).match(fqdn) is not None
+
+
+_ENGINES = {
+    "regex": _regex_is_valid,
+    "scanner": _scanner.is_valid,
+}
+
+
+def _engine(name):
+    """
+    The validation function for an ``engine`` option, which is called with
+    ``(fqdn, allow_underscores, min_labels)``.
+    """
+    try:
+        return _ENGINES[name or _DEFAULT_ENGINE]
+    except KeyError:
+        raise ValueError(
+            "engine must be one of {0}, got {1!r}".format(sorted(_ENGINES), name)
+        )
+
+
+def _bind_engine(engine, allow_underscores, min_labels):
+    """
+    A one argument validation function for a fixed combination of options.
+    The argument must be a non-empty ``str``.
+    """
+    is_valid = _engine(engine)
+    if is_valid is not _regex_is_valid:
+        return lambda fqdn: is_valid(fqdn, allow_underscores, min_labels)
+
+    match = _compiled_regex(allow_underscores, min_labels).match
+
+    def regex_is_valid(fqdn):
+        length = len(fqdn)
+        if fqdn[-1] == ".":
+            length -= 1
+        return length <= 253 and str_isascii(fqdn) and match(fqdn) is not None
+
+    return regex_is_valid
+
+
+class Validator:
+    """
+    Validation and normalization with one fixed combination of the
+    ``FQDN`` options, resolved once, along with the compiled pattern or
+    validation function, so that the methods do no option handling per
+    call. The results are those of ``FQDN(fqdn, **options)``, and like the
+    constructor the methods raise ``ValueError`` for anything that is not a
+    non-empty ``str``.
+
+    >>> strict = Validator(min_labels=3)
+    >>> strict.is_valid('bbc.co.uk'), strict.is_valid('bbc.com')
+    (True, False)
+    >>> strict.absolute('BBC.co.uk')
+    'bbc.co.uk.'
+    """
+
+    def __init__(self, allow_underscores=False, min_labels=2, engine=None):
+        self._allow_underscores = allow_underscores
+        self._min_labels = min_labels
+        self._is_valid = _bind_engine(engine, allow_underscores, min_labels)
+
+    def is_valid(self, fqdn):
+        """
+        ``FQDN.is_valid`` for ``fqdn``.
+        """
+        if not (fqdn and isinstance(fqdn, str)):
+            raise ValueError("fqdn must be str")
+        if not str_isascii(fqdn):
+            fqdn = fqdn.lower()
+        return self._is_valid(fqdn)
+
+    def _lowered_valid(self, fqdn):
+        if not (fqdn and isinstance(fqdn, str)):
+            raise ValueError("fqdn must be str")
+        fqdn = fqdn.lower()
+        if not self._is_valid(fqdn):
+            raise ValueError("invalid FQDN `{0}`".format(fqdn))
+        return fqdn
+
+    def absolute(self, fqdn):
+        """
+        ``FQDN.absolute`` for ``fqdn``, raising ``ValueError`` if it is
+        invalid.
+        """
+        fqdn = self._lowered_valid(fqdn)
+        return fqdn if fqdn.endswith(".") else "{0}.".format(fqdn)
+
+    def relative(self, fqdn):
+        """
+        ``FQDN.relative`` for ``fqdn``, raising ``ValueError`` if it is
+        invalid.
+        """
+        fqdn = self._lowered_valid(fqdn)
+        return fqdn[:-1] if fqdn.endswith(".") else fqdn
+
+    def validate_many(self, fqdns):
+        """
+        ``validate_many`` with these options: a ``bytearray`` holding ``1``
+        for each valid and ``0`` for each invalid name, in input order.
+        """
+        is_valid = self._is_valid
+        results = bytearray()
+        append = results.append
+        for fqdn in fqdns:
+            if not (fqdn and isinstance(fqdn, str)):
+                raise ValueError("fqdn must be str")
+            if not str_isascii(fqdn):
+                # a few non-ASCII letters only lowercase into or out of the
+                # preferred name syntax, so match what the constructor sees
+                fqdn = fqdn.lower()
+            append(is_valid(fqdn))
+        return results
+
+    def absolute_many(self, fqdns):
+        """
+        A list of the absolute form of each name, or None for an invalid
+        name, in input order.
+        """
+        is_valid = self._is_valid
+        results = []
+        append = results.append
+        for fqdn in fqdns:
+            if not (fqdn and isinstance(fqdn, str)):
+                raise ValueError("fqdn must be str")
+            fqdn = fqdn.lower()
+            if not is_valid(fqdn):
+                append(None)
+            elif fqdn.endswith("."):
+                append(fqdn)
+            else:
+                append("{0}.".format(fqdn))
+        return results
+
+
+def validate_many(fqdns, allow_underscores=False, min_labels=2, engine=None):
+    """
+    Validate an iterable of strings without constructing ``FQDN`` objects.
+
+    Returns a ``bytearray`` holding ``1`` for each valid and ``0`` for each
+    invalid name, in input order. The options and results are the same as
+    ``FQDN(fqdn, **options).is_valid``, and like the constructor this raises
+    ``ValueError`` for anything that is not a non-empty ``str``.
+    """
+    return Validator(allow_underscores, min_labels, engine).validate_many(fqdns)
+
+
+def is_valid_fqdn(name, allow_underscores=False, min_labels=2, absolute=None):
+    """
+    ``FQDN(name, **options).is_valid`` without constructing an ``FQDN``, or
+    ``is_valid_absolute`` when ``absolute`` is True and ``is_valid_relative``
+    when it is False. Like the constructor, this raises ``ValueError`` for
+    anything that is not a non-empty ``str``.
+
+    The validation function for each combination of options is bound once,
+    and ASCII names are validated as they are, so a call costs little more
+    than the validation itself.
+
+    >>> is_valid_fqdn('bbc.co.uk'), is_valid_fqdn('bbc.co.uk', absolute=True)
+    (True, False)
+    """
+    if not (name and isinstance(name, str)):
+        raise ValueError("fqdn must be str")
+    if absolute is not None and (name[-1] == ".") is not bool(absolute):
+        return False
+    key = (_DEFAULT_ENGINE, allow_underscores, min_labels)
+    try:
+        is_valid = _BOUND_ENGINES[key]
+    except KeyError:
+        is_valid = _BOUND_ENGINES[key] = _bind_engine(
+            None, allow_underscores, min_labels
+        )
+    if not str_isascii(name):
+        name = name.lower()
+    return is_valid(name)
+
+
+def validate(fqdn, allow_underscores=False, min_labels=2):
+    """
+    ``FQDN(fqdn, **options).validation_result`` without constructing an
+    ``FQDN``, in a single pass over the name.
+
+    Valid names return the ``VALID`` singleton at the cost of the ``"scanner"``
+    engine, so this can replace an ``is_valid`` check on the hot path and
+    still say why a name was rejected:
+
+    >>> validate('www.example.com') is VALID
+    True
+    >>> validate('www.-example.com')
+    ValidationResult('leading_hyphen', label=1, offset=4)
+    """
+    if not (fqdn and isinstance(fqdn, str)):
+        raise ValueError("fqdn must be str")
+    if not str_isascii(fqdn):
+        fqdn = fqdn.lower()
+    return _scanner.check(fqdn, allow_underscores, min_labels)
+
+
+def _as_buffer(fqdn):
+    if isinstance(fqdn, memoryview):
+        if not hasattr(fqdn, "cast"):
+            # a Python 2 memoryview can be neither cast nor matched by a
+            # regex, so it is copied
+            fqdn = fqdn.tobytes()
+        # names are checked in place, which needs one contiguous run of bytes
+        elif not fqdn.c_contiguous:
+            raise ValueError("fqdn memoryview must be C-contiguous")
+        elif fqdn.format != "B" or fqdn.ndim != 1:
+            fqdn = fqdn.cast("B")
+    elif not isinstance(fqdn, (bytes, bytearray)):
+        raise ValueError("fqdn must be bytes, bytearray or memoryview")
+    if not fqdn:
+        raise ValueError("fqdn must not be empty")
+    return fqdn
+
+
+def is_valid_bytes(fqdn, allow_underscores=False, min_labels=2):
+    """
+    ``FQDN.is_valid`` for ``bytes``, ``bytearray`` or ``memoryview`` input,
+    checked in place without decoding or copying it.
+
+    Only ASCII is accepted, so unlike ``FQDN``, which lowercases ``str``
+    input, this does not accept the UTF-8 encoded KELVIN SIGN as a ``k``.
+
+    On Python 2, a ``memoryview`` is copied to ``bytes`` before it is
+    checked.
+    """
+    fqdn = _as_buffer(fqdn)
+    length = len(fqdn)
+    # a slice, as indexing Python 2 bytes gives a str rather than an int
+    if fqdn[-1:] == b".":
+        length -= 1
+    if length > 253:
+        return False
+    regex = _compiled_regex(allow_underscores, min_labels, binary=True)
+    return regex.match(fqdn) is not None
+
+
+def absolute_bytes(fqdn, allow_underscores=False, min_labels=2):
+    """
+    ``FQDN.absolute`` for bytes-like input, as lowercase ``bytes``. Raises
+    ``ValueError`` for an invalid name, before anything is copied.
+    """
+    fqdn = _as_buffer(fqdn)
+    if not is_valid_bytes(fqdn, allow_underscores, min_labels):
+        raise ValueError("invalid FQDN `{0!r}`".format(bytes(fqdn)))
+    lowered = bytes(fqdn).lower()
+    return lowered if lowered.endswith(b".") else lowered + b"."
+
+
+def relative_bytes(fqdn, allow_underscores=False, min_labels=2):
+    """
+    ``FQDN.relative`` for bytes-like input, as lowercase ``bytes``. Raises
+    ``ValueError`` for an invalid name, before anything is copied.
+    """
+    fqdn = _as_buffer(fqdn)
+    if not is_valid_bytes(fqdn, allow_underscores, min_labels):
+        raise ValueError("invalid FQDN `{0!r}`".format(bytes(fqdn)))
+    lowered = bytes(fqdn).lower()
+    return lowered[:-1] if lowered.endswith(b".") else lowered
@@ -0,0 +1,201 @@
+"""
+Validate newline-delimited names from files or stdin.
+
+    python -m fqdn [options] [FILE ...]
+
+Each line is one name. By default every name is written back followed by a
+tab and ``valid`` or ``invalid``. ``--valid`` and ``--invalid`` write only the
+matching names, and ``--absolute`` and ``--relative`` rewrite valid names in
+that normalized form. Input is read and output written in large chunks, so
+memory use does not grow with the size of the input.
+
+It needs Python 3.
+"""
+import argparse
+import os
+import sys
+import time
+
+from fqdn import _bind_engine
+from fqdn._compat import str_isascii
+
+CHUNK_SIZE = 1 << 20
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m fqdn",
+        description="Validate newline-delimited fully-qualified domain names.",
+    )
+    parser.add_argument(
+        "files",
+        metavar="FILE",
+        nargs="*",
+        default=["-"],
+        help="files to read, or - for stdin (the default)",
+    )
+    parser.add_argument(
+        "--allow-underscores",
+        action="store_true",
+        help="allow underscores in labels",
+    )
+    parser.add_argument(
+        "--min-labels",
+        type=int,
+        default=2,
+        metavar="N",
+        help="minimum number of labels (default: %(default)s)",
+    )
+    normalize = parser.add_mutually_exclusive_group()
+    normalize.add_argument(
+        "--absolute",
+        action="store_const",
+        const="absolute",
+        dest="normalize",
+        help="write valid names in lowercase absolute form",
+    )
+    normalize.add_argument(
+        "--relative",
+        action="store_const",
+        const="relative",
+        dest="normalize",
+        help="write valid names in lowercase relative form",
+    )
+    select = parser.add_mutually_exclusive_group()
+    select.add_argument(
+        "--valid",
+        action="store_const",
+        const="valid",
+        dest="select",
+        help="write only valid names",
+    )
+    select.add_argument(
+        "--invalid",
+        action="store_const",
+        const="invalid",
+        dest="select",
+        help="write only invalid names",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="report line counts and throughput on stderr",
+    )
+    return parser
+
+
+def _chunks(stream):
+    """
+    Lists of names, without their line endings, read ``CHUNK_SIZE`` bytes at
+    a time.
+    """
+    while True:
+        lines = stream.readlines(CHUNK_SIZE)
+        if not lines:
+            return
+        text = b"".join(lines).decode("utf-8", "surrogateescape")
+        names = text.split("\n")
+        if not names[-1]:
+            names.pop()
+        if "\r" in text:
+            names = [name.rstrip("\r") for name in names]
+        yield names
+
+
+def _format(name, valid, normalize, select):
+    if valid and normalize:
+        name = name.lower()
+        if normalize == "absolute":
+            if not name.endswith("."):
+                name += "."
+        elif name.endswith("."):
+            name = name[:-1]
+    if select:
+        return name
+    return "{0}\t{1}".format(name, "valid" if valid else "invalid")
+
+
+def run(
+    streams,
+    output,
+    allow_underscores=False,
+    min_labels=2,
+    normalize=None,
+    select=None,
+):
+    """
+    Validate the names in binary ``streams`` and write the results to the
+    binary ``output``. Returns the counts of valid and invalid names.
+    """
+    is_valid = _bind_engine(None, allow_underscores, min_labels)
+    keep = {None: (True, False), "valid": (True,), "invalid": (False,)}[select]
+    valid_count = invalid_count = 0
+    for stream in streams:
+        for names in _chunks(stream):
+            out = []
+            for name in names:
+                valid = bool(name) and is_valid(
+                    name if str_isascii(name) else name.lower()
+                )
+                if valid:
+                    valid_count += 1
+                else:
+                    invalid_count += 1
+                if valid in keep:
+                    out.append(_format(name, valid, normalize, select))
+            if out:
+                out.append("")
+                output.write("\n".join(out).encode("utf-8", "surrogateescape"))
+    return valid_count, invalid_count
+
+
+def _streams(paths):
+    for path in paths:
+        if path == "-":
+            yield sys.stdin.buffer
+            continue
+        with open(path, "rb", buffering=CHUNK_SIZE) as stream:
+            yield stream
+
+
+def main(argv=None):
+    if sys.version_info < (3, 0):
+        sys.stderr.write("python -m fqdn: needs Python 3\n")
+        return 2
+    args = _parser().parse_args(argv)
+    start = time.perf_counter()
+    try:
+        valid, invalid = run(
+            _streams(args.files),
+            sys.stdout.buffer,
+            allow_underscores=args.allow_underscores,
+            min_labels=args.min_labels,
+            normalize=args.normalize,
+            select=args.select,
+        )
+        sys.stdout.buffer.flush()
+    # BrokenPipeError is Python 3 only, and main returns before this on Python 2
+    except BrokenPipeError:  # noqa: F821
+        # the reader went away, as with `| head`; point stdout at devnull so
+        # the interpreter does not fail flushing it on exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except OSError as e:
+        sys.stderr.write("python -m fqdn: {0}\n".format(e))
+        return 2
+
+    if args.stats:
+        elapsed = time.perf_counter() - start
+        lines = valid + invalid
+        rate = lines / elapsed if elapsed else 0
+        sys.stderr.write(
+            "{0} lines, {1} valid, {2} invalid in {3:.3f}s ({4:.0f} lines/s)\n".format(
+                lines, valid, invalid, elapsed, rate
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
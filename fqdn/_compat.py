@@ -1,8 +1,57 @@
 import sys
 
-if sys.version_info[:2] >= (3, 8):
-    from functools import cached_property
+
+class cached_property(object):
+    """
+    A property computed on first access and then stored in the instance
+    ``__dict__``, which takes precedence over this non-data descriptor on
+    every later access.
+
+    This is the subset of ``functools.cached_property`` that ``FQDN`` uses.
+    It is defined here so that importing the package does not import
+    ``functools``, or the ``cached_property`` package on interpreters older
+    than 3.8, and so that the first access takes no lock, as
+    ``functools.cached_property`` does before Python 3.12.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.attrname] = self.func(instance)
+        return value
+
+
+if sys.version_info[:2] >= (3, 7):
+    str_isascii = str.isascii
 else:
-    from cached_property import cached_property
 
-__all__ = ["cached_property"]
+    def str_isascii(s):
+        # every non-ASCII code point, lone surrogates included, encodes to
+        # more than one byte. Python 2 decodes a byte string as ASCII before
+        # encoding it, which fails on any byte above 127.
+        try:
+            return len(s.encode("utf-8", "surrogatepass")) == len(s)
+        except UnicodeDecodeError:
+            return False
+
+
+if sys.version_info[0] >= 3:
+
+    def move_to_end(entries, key):
+        entries.move_to_end(key)
+
+
+else:
+
+    def move_to_end(entries, key):
+        # OrderedDict.move_to_end is Python 3 only; like it, this raises
+        # KeyError for a missing key
+        entries[key] = entries.pop(key)
+
+
+__all__ = ["cached_property", "move_to_end", "str_isascii"]
@@ -0,0 +1,158 @@
+"""
+A validation engine for the preferred name syntax that does not use regular
+expressions.
+
+The ``FQDN.PREFERRED_NAME_SYNTAX_REGEXSTR`` pattern rejects hyphens at either
+end of a label with lookahead and lookbehind assertions, and on names with
+many labels the regex engine backtracks through every label on failure. This
+engine makes a bounded number of passes over the string instead: one for the
+character set, one to split it into labels, then a constant amount of work per
+label to check its length and hyphens. The cost is linear in the length of the
+name whether it is valid or not.
+"""
+
+from fqdn._compat import str_isascii
+
+LDH_CHARS = "-.0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LDH_UNDERSCORE_CHARS = LDH_CHARS + "_"
+
+
+def is_valid(fqdn, allow_underscores=False, min_labels=2):
+    """
+    True when ``fqdn`` is in the preferred name syntax, exactly as
+    ``FQDN.is_valid`` decides it with the regex engine.
+    """
+    length = len(fqdn)
+    absolute = fqdn.endswith(".")
+    if absolute:
+        length -= 1
+    if length > 253 or not str_isascii(fqdn):
+        return False
+    # str.strip stops at the first character outside the set, from either
+    # end, so anything left over means the name has a disallowed character
+    if fqdn.strip(LDH_UNDERSCORE_CHARS if allow_underscores else LDH_CHARS):
+        return False
+
+    labels = fqdn.split(".")
+    if absolute:
+        labels.pop()
+    # not <, which would accept every name for a NaN min_labels
+    if not len(labels) >= min_labels:
+        return False
+    for label in labels:
+        if not label or len(label) > 63 or label[0] == "-" or label[-1] == "-":
+            return False
+    return True
+
+
+def is_valid_label(label, allow_underscores=False):
+    """
+    True when ``label`` is a single label in the preferred name syntax: 1 to
+    63 characters from the character set, with no hyphen at either end.
+    """
+    if not 0 < len(label) <= 63 or "." in label:
+        return False
+    if label.strip(LDH_UNDERSCORE_CHARS if allow_underscores else LDH_CHARS):
+        return False
+    return label[0] != "-" and label[-1] != "-"
+
+
+class ValidationResult(object):
+    """
+    Why a name is valid or not: a reason ``code``, the index of the offending
+    ``label``, counted from the left, and the ``offset`` in the name of the
+    offending character. ``label`` and ``offset`` are None for a valid name.
+
+    Truthy for a valid name only. Every valid name gets the same ``VALID``
+    instance, so a check for validity allocates nothing.
+    """
+
+    __slots__ = ("code", "label", "offset")
+
+    OK = "ok"
+    TOO_LONG = "too_long"
+    BAD_CHARACTER = "bad_character"
+    EMPTY_LABEL = "empty_label"
+    LABEL_TOO_LONG = "label_too_long"
+    LEADING_HYPHEN = "leading_hyphen"
+    TRAILING_HYPHEN = "trailing_hyphen"
+    TOO_FEW_LABELS = "too_few_labels"
+
+    def __init__(self, code, label=None, offset=None):
+        self.code = code
+        self.label = label
+        self.offset = offset
+
+    def __bool__(self):
+        return self.code == ValidationResult.OK
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        if isinstance(other, ValidationResult):
+            return (self.code, self.label, self.offset) == (
+                other.code,
+                other.label,
+                other.offset,
+            )
+        return NotImplemented
+
+    def __ne__(self, other):
+        # Python 2 does not derive != from __eq__
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash((self.code, self.label, self.offset))
+
+    def __repr__(self):
+        return "ValidationResult({0!r}, label={1!r}, offset={2!r})".format(
+            self.code, self.label, self.offset
+        )
+
+
+VALID = ValidationResult(ValidationResult.OK)
+
+
+def check(fqdn, allow_underscores=False, min_labels=2):
+    """
+    ``is_valid`` with the reason for an invalid name, as a
+    ``ValidationResult``. Valid names take the same path as ``is_valid`` and
+    return ``VALID``; the details are only worked out for invalid names.
+    """
+    length = len(fqdn)
+    absolute = fqdn.endswith(".")
+    if absolute:
+        length -= 1
+    if length > 253:
+        return ValidationResult(ValidationResult.TOO_LONG, fqdn.count(".", 0, 253), 253)
+    chars = LDH_UNDERSCORE_CHARS if allow_underscores else LDH_CHARS
+    if fqdn.strip(chars):
+        offset = len(fqdn) - len(fqdn.lstrip(chars))
+        return ValidationResult(
+            ValidationResult.BAD_CHARACTER, fqdn.count(".", 0, offset), offset
+        )
+
+    labels = fqdn.split(".")
+    if absolute:
+        labels.pop()
+    for label in labels:
+        if not label or len(label) > 63 or label[0] == "-" or label[-1] == "-":
+            # an earlier equal label would have failed first, so this is the
+            # index of the offending one
+            index = labels.index(label)
+            start = sum(map(len, labels[:index])) + index
+            if not label:
+                return ValidationResult(ValidationResult.EMPTY_LABEL, index, start)
+            if len(label) > 63:
+                return ValidationResult(
+                    ValidationResult.LABEL_TOO_LONG, index, start + 63
+                )
+            if label[0] == "-":
+                return ValidationResult(ValidationResult.LEADING_HYPHEN, index, start)
+            return ValidationResult(
+                ValidationResult.TRAILING_HYPHEN, index, start + len(label) - 1
+            )
+    if not len(labels) >= min_labels:
+        return ValidationResult(ValidationResult.TOO_FEW_LABELS, len(labels), len(fqdn))
+    return VALID
@@ -0,0 +1,205 @@
+"""
+Opt-in counters and sampled timings for ``FQDN``, installed by
+``fqdn.enable_stats``.
+
+Nothing here runs while statistics are disabled: enabling them replaces
+``FQDN.__init__`` and every ``cached_property`` of the class with counting
+wrappers, and disabling them puts the originals back. The wrappers around
+cached properties are data descriptors, so they also see the accesses that a
+``cached_property`` leaves to the instance ``__dict__``, and can count them
+as cache hits.
+"""
+import time
+
+from fqdn import _scanner
+from fqdn._compat import cached_property
+
+try:
+    perf_counter_ns = time.perf_counter_ns
+except AttributeError:  # Python < 3.7
+    # time.perf_counter is Python 3 only
+    _perf_counter = getattr(time, "perf_counter", time.time)
+
+    def perf_counter_ns():
+        return int(_perf_counter() * 1e9)
+
+
+class Stats:
+    """
+    Counters and timing histograms for ``FQDN``, returned by
+    ``enable_stats``.
+
+    Counters are named like statsd metrics:
+
+    * ``constructed``: ``FQDN`` instances created;
+    * ``computed.<attribute>``: first accesses to a cached property, such as
+      ``computed.is_valid`` for each validation. With the validation cache
+      enabled, validations are counted when the cache misses instead;
+    * ``hit.<attribute>``: accesses answered from the instance, including
+      values the validation cache set;
+    * ``rejected.<code>``: invalid names, by ``ValidationResult`` code.
+
+    One in every ``sample_every`` constructions and computations is timed,
+    into a histogram of power of two buckets in nanoseconds, keyed on
+    ``construct`` or the attribute name. ``callback``, when given, is called
+    as ``callback(metric, value)`` for every counter increment, with a value
+    of 1, and for every timing, as ``time.<name>`` with the nanoseconds.
+
+    Updates are best effort when several threads use ``FQDN`` at once.
+    """
+
+    def __init__(self, sample_every=0, callback=None):
+        if sample_every < 0:
+            raise ValueError("sample_every must be at least 0")
+        self.sample_every = sample_every
+        self.callback = callback
+        self._until_sample = sample_every
+        self._counters = {}
+        self._timings = {}
+        self._originals = {}
+
+    def count(self, metric):
+        counters = self._counters
+        counters[metric] = counters.get(metric, 0) + 1
+        if self.callback is not None:
+            self.callback(metric, 1)
+
+    def sample(self):
+        """
+        True when the next operation should be timed.
+        """
+        if not self.sample_every:
+            return False
+        self._until_sample -= 1
+        if self._until_sample > 0:
+            return False
+        self._until_sample = self.sample_every
+        return True
+
+    def record_time(self, name, elapsed_ns):
+        bucket = 1 << elapsed_ns.bit_length()
+        histogram = self._timings.setdefault(name, {})
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+        if self.callback is not None:
+            self.callback("time.{0}".format(name), elapsed_ns)
+
+    def count_rejected(self, fqdn, allow_underscores, min_labels):
+        """
+        Count an invalid name under the code of its ``ValidationResult``.
+        """
+        result = _scanner.check(fqdn, allow_underscores, min_labels)
+        self.count("rejected.{0}".format(result.code))
+
+    def validate(self, engine, fqdn, allow_underscores, min_labels):
+        """
+        ``engine(fqdn, allow_underscores, min_labels)``, counted and timed as
+        an ``is_valid`` computation. The validation cache calls it on a miss,
+        as the instances it builds find ``is_valid`` already set.
+        """
+        self.count("computed.is_valid")
+        if self.sample():
+            start = perf_counter_ns()
+            is_valid = engine(fqdn, allow_underscores, min_labels)
+            self.record_time("is_valid", perf_counter_ns() - start)
+        else:
+            is_valid = engine(fqdn, allow_underscores, min_labels)
+        if not is_valid:
+            self.count_rejected(fqdn, allow_underscores, min_labels)
+        return is_valid
+
+    def snapshot(self):
+        """
+        A copy of the statistics so far, as a dict with ``"counters"``,
+        mapping metric names to counts, and ``"timings"``, mapping names to
+        histograms, which map the upper bound of each bucket in nanoseconds
+        to a count.
+        """
+        return {
+            "counters": dict(self._counters),
+            "timings": {
+                name: dict(histogram) for name, histogram in self._timings.items()
+            },
+        }
+
+    def clear(self):
+        """
+        Reset every counter and histogram.
+        """
+        self._counters.clear()
+        self._timings.clear()
+
+    def install(self, cls):
+        """
+        Replace ``cls.__init__`` and the cached properties of ``cls`` with
+        wrappers that record into this instance.
+        """
+        for name, attribute in list(vars(cls).items()):
+            if isinstance(attribute, cached_property):
+                self._originals[name] = attribute
+                setattr(cls, name, _CountingProperty(attribute, self))
+        self._originals["__init__"] = init = cls.__init__
+
+        def __init__(instance, *args, **kwargs):
+            if self.sample():
+                start = perf_counter_ns()
+                init(instance, *args, **kwargs)
+                self.record_time("construct", perf_counter_ns() - start)
+            else:
+                init(instance, *args, **kwargs)
+            self.count("constructed")
+
+        __init__.__doc__ = init.__doc__
+        cls.__init__ = __init__
+
+    def uninstall(self, cls):
+        """
+        Put back what ``install`` replaced.
+        """
+        for name, attribute in self._originals.items():
+            setattr(cls, name, attribute)
+        self._originals.clear()
+
+
+class _CountingProperty(object):
+    """
+    A data descriptor in place of a ``cached_property``, which stores values
+    in the instance ``__dict__`` the same way, so instances created while it
+    is installed keep working once it is removed.
+    """
+
+    def __init__(self, prop, stats):
+        self.prop = prop
+        self.attrname = prop.attrname
+        self.__doc__ = prop.__doc__
+        self._stats = stats
+        self._computed = "computed.{0}".format(prop.attrname)
+        self._hit = "hit.{0}".format(prop.attrname)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        stats = self._stats
+        try:
+            value = instance.__dict__[self.attrname]
+        except KeyError:
+            pass
+        else:
+            stats.count(self._hit)
+            return value
+
+        stats.count(self._computed)
+        if stats.sample():
+            start = perf_counter_ns()
+            value = self.prop.func(instance)
+            stats.record_time(self.attrname, perf_counter_ns() - start)
+        else:
+            value = self.prop.func(instance)
+        instance.__dict__[self.attrname] = value
+        if self.attrname == "is_valid" and not value:
+            stats.count_rejected(
+                instance._fqdn, instance._allow_underscores, instance._min_labels
+            )
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.attrname] = value
@@ -0,0 +1,104 @@
+"""
+Validate names from asyncio pipelines without blocking the event loop.
+
+``validate_stream`` consumes an async iterable of names and validates them in
+batches of at most ``batch_size`` with ``validate_many``, returning control to
+the event loop after each batch. Batches of ``offload_size`` names or more can
+be handed to an executor instead, so the loop keeps running while they are
+validated.
+
+It needs Python 3.5 or later.
+"""
+import asyncio
+
+from fqdn import validate_many
+
+try:
+    get_running_loop = asyncio.get_running_loop
+except AttributeError:  # Python < 3.7
+    get_running_loop = asyncio.get_event_loop
+
+
+def validate_stream(
+    names,
+    allow_underscores=False,
+    min_labels=2,
+    batch_size=1024,
+    executor=None,
+    offload_size=None,
+):
+    """
+    An async iterator of a ``(name, is_valid)`` pair for each name from the
+    async iterable ``names``, in order, with the same options and results as
+    ``validate_many``.
+
+    Names are held until ``batch_size`` have arrived or the input ends, so a
+    smaller batch gives lower latency on slow streams and a larger one less
+    overhead on fast ones.
+
+    When ``executor`` is given, batches of ``offload_size`` names or more
+    (by default every batch) are validated in it with
+    ``loop.run_in_executor``. Otherwise, and for smaller batches, they are
+    validated inline.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if offload_size is None:
+        offload_size = 0 if executor is not None else batch_size + 1
+    return _ValidatedStream(
+        names, allow_underscores, min_labels, batch_size, executor, offload_size
+    )
+
+
+class _ValidatedStream:
+    """
+    The iterator ``validate_stream`` returns. It is a class rather than an
+    async generator, which needs Python 3.6.
+    """
+
+    def __init__(
+        self, names, allow_underscores, min_labels, batch_size, executor, offload_size
+    ):
+        self._names = names.__aiter__()
+        self._allow_underscores = allow_underscores
+        self._min_labels = min_labels
+        self._batch_size = batch_size
+        self._executor = executor
+        self._offload_size = offload_size
+        self._pairs = iter(())
+        self._exhausted = False
+
+    def __aiter__(self):
+        return self
+
+    async def _validate(self, batch):
+        if self._executor is not None and len(batch) >= self._offload_size:
+            results = await get_running_loop().run_in_executor(
+                self._executor,
+                validate_many,
+                batch,
+                self._allow_underscores,
+                self._min_labels,
+            )
+        else:
+            results = validate_many(batch, self._allow_underscores, self._min_labels)
+            await asyncio.sleep(0)
+        return zip(batch, map(bool, results))
+
+    async def __anext__(self):
+        while True:
+            pair = next(self._pairs, None)
+            if pair is not None:
+                return pair
+            if self._exhausted:
+                raise StopAsyncIteration
+            batch = []
+            while len(batch) < self._batch_size:
+                try:
+                    name = await self._names.__anext__()
+                except StopAsyncIteration:
+                    self._exhausted = True
+                    break
+                batch.append(name)
+            if batch:
+                self._pairs = await self._validate(batch)
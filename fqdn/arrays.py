@@ -0,0 +1,220 @@
+"""
+Validate columns of names held in NumPy or Arrow arrays.
+
+``validate_array`` takes a NumPy ``S`` or ``U`` array, or an Arrow ``string``
+or ``large_string`` array, and returns a NumPy boolean mask. The checks run
+as array operations over the whole buffer, a block of rows at a time, instead
+of one Python call per name:
+
+* the length of each name, with its trailing dot removed;
+* the character set, with a lookup table indexed by byte;
+* empty labels and hyphens next to a dot or at either end, as forbidden
+  pairs of adjacent bytes;
+* labels longer than 63 bytes, from the distance of each byte to the start of
+  its label;
+* the number of labels, from the number of dots.
+
+Rows with non-ASCII text in ``U`` and Arrow arrays are rare and are decided
+by the scalar path, as ``FQDN`` lowercases them before validating. The
+result is exactly ``FQDN(name, **options).is_valid`` for text, and
+``is_valid_bytes(name, **options)`` for ``S`` arrays, with ``False`` for
+empty names and Arrow nulls.
+
+NumPy is required, and pyarrow for Arrow input. They are installed with the
+``numpy`` and ``arrow`` extras::
+
+    pip install fqdn[numpy]
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "fqdn.arrays requires NumPy, install it with `pip install fqdn[numpy]`"
+    )
+
+from fqdn import _bind_engine, _scanner
+
+# the number of bytes checked at once, which bounds the temporary arrays
+BLOCK_SIZE = 1 << 22
+
+_DOT = ord(".")
+_HYPHEN = ord("-")
+
+
+def _charset_table(allow_underscores):
+    if allow_underscores:
+        chars = _scanner.LDH_UNDERSCORE_CHARS
+    else:
+        chars = _scanner.LDH_CHARS
+    table = np.zeros(256, dtype=bool)
+    table[np.frombuffer(chars.encode("ascii"), dtype=np.uint8)] = True
+    return table
+
+
+def _check(data, lengths, table, min_labels):
+    """
+    Validate ASCII names stored one after another in ``data``, a ``uint8``
+    buffer of at most ``BLOCK_SIZE`` bytes, with the length of each name in
+    ``lengths``.
+    """
+    count = len(lengths)
+    if not len(data):
+        return np.zeros(count, dtype=bool)
+    last = len(data) - 1
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    absolute = (lengths > 0) & (data[np.clip(ends - 1, 0, last)] == _DOT)
+    rel_lengths = lengths - absolute
+    valid = (rel_lengths > 0) & (rel_lengths <= 253)
+
+    is_dot = data == _DOT
+    edge = is_dot | (data == _HYPHEN)
+    valid &= ~edge[np.clip(starts, 0, last)]
+    valid &= ~edge[np.clip(starts + rel_lengths - 1, 0, last)]
+
+    # every byte that makes its name invalid: bytes outside the character
+    # set, the second byte of "..", ".-" or "-.", which are an empty label or
+    # a hyphen at the end of a label, and the 64th byte of a label. A pair
+    # across two names only marks a name that starts with a dot or hyphen,
+    # which is invalid already.
+    bad = ~table[data]
+    bad[1:] |= (is_dot[:-1] & edge[1:]) | (edge[:-1] & is_dot[1:])
+    # a label starts at the start of a name or at the byte after a dot
+    label_starts = np.zeros(len(data), dtype=np.int32)
+    after_dots = np.flatnonzero(is_dot[:-1]) + 1
+    label_starts[after_dots] = after_dots
+    nonempty_starts = starts[lengths > 0]
+    label_starts[nonempty_starts] = nonempty_starts
+    np.maximum.accumulate(label_starts, out=label_starts)
+    bad |= (np.arange(len(data), dtype=np.int32) - label_starts >= 63) & ~is_dot
+
+    # bad bytes are rare, so look up the names they are in rather than
+    # counting them for every name
+    names = np.repeat(np.arange(count, dtype=np.int32), lengths)
+    valid[names[bad]] = False
+    # not > 1, which would skip the count for a NaN min_labels
+    if not min_labels <= 1:
+        dots = np.bincount(names[is_dot], minlength=count)
+        valid &= dots - absolute + 1 >= min_labels
+    return valid
+
+
+def _validate_fixed_width(values, allow_underscores, min_labels):
+    flat = values.reshape(-1)
+    count = len(flat)
+    result = np.zeros(count, dtype=bool)
+    width = flat.dtype.itemsize
+    if flat.dtype.kind == "U":
+        width //= 4
+    if not (count and width):
+        return result.reshape(values.shape)
+
+    table = _charset_table(allow_underscores)
+    is_valid = _bind_engine(None, allow_underscores, min_labels)
+    columns = min(width, 254)
+    # a block holds at most 254 bytes per name once the padding is dropped
+    step = max(1, BLOCK_SIZE // columns)
+    for first in range(0, count, step):
+        block = flat[first : first + step]
+        # NumPy drops trailing NULs from each item, and names longer than 254
+        # are invalid whatever they hold, so leave those out along with the
+        # padding, as empty names
+        lengths = np.char.str_len(block)
+        lengths[lengths > 254] = 0
+        if block.dtype.kind == "U":
+            rows = block.view(np.uint32).reshape(len(block), width)[:, :columns]
+        else:
+            rows = block.view(np.uint8).reshape(len(block), width)[:, :columns]
+        data = rows[np.arange(columns) < lengths[:, None]]
+        non_ascii = ()
+        if block.dtype.kind == "U":
+            wide = data > 127
+            if wide.any():
+                ends = np.cumsum(lengths)
+                non_ascii = np.unique(
+                    np.searchsorted(ends, np.flatnonzero(wide), side="right")
+                )
+                data = np.where(wide, 0, data)
+            data = data.astype(np.uint8)
+        valid = _check(data, lengths, table, min_labels)
+        for index in non_ascii:
+            valid[index] = is_valid(str(block[index]).lower())
+        result[first : first + len(block)] = valid
+    return result.reshape(values.shape)
+
+
+def _validate_arrow_chunk(values, pa, allow_underscores, min_labels):
+    if pa.types.is_string(values.type):
+        offset_type = np.int32
+    elif pa.types.is_large_string(values.type):
+        offset_type = np.int64
+    else:
+        raise ValueError(
+            "values must be an Arrow string array, got {0}".format(values.type)
+        )
+    count = len(values)
+    result = np.zeros(count, dtype=bool)
+    if not count:
+        return result
+    _, offsets, data = values.buffers()
+    offsets = np.frombuffer(offsets, dtype=offset_type)
+    offsets = offsets[values.offset : values.offset + count + 1].astype(np.intp)
+    if data is None:
+        return result
+    data = np.frombuffer(data, dtype=np.uint8)
+
+    table = _charset_table(allow_underscores)
+    is_valid = _bind_engine(None, allow_underscores, min_labels)
+    not_null = ~values.is_null().to_numpy(zero_copy_only=False)
+    first = 0
+    while first < count:
+        # as many names as fit in a block, and at least one
+        last = np.searchsorted(offsets, offsets[first] + BLOCK_SIZE, side="right")
+        last = min(max(last - 1, first + 1), count)
+        block = data[offsets[first] : offsets[last]]
+        ends = offsets[first + 1 : last + 1] - offsets[first]
+        valid = _check(block, np.diff(offsets[first : last + 1]), table, min_labels)
+        non_ascii = np.unique(
+            np.searchsorted(ends, np.flatnonzero(block > 127), side="right")
+        )
+        for index in non_ascii:
+            if not_null[first + index]:
+                name = block[ends[index - 1] if index else 0 : ends[index]]
+                valid[index] = is_valid(name.tobytes().decode("utf-8").lower())
+        result[first:last] = valid
+        first = last
+    return result & not_null
+
+
+def validate_array(values, allow_underscores=False, min_labels=2):
+    """
+    A boolean mask of the valid names in a NumPy ``S`` or ``U`` array of any
+    shape, or in an Arrow ``string`` or ``large_string`` array or chunked
+    array, with the same options and results as ``FQDN.is_valid``.
+
+    Raises ``ValueError`` for any other type of array.
+
+    >>> validate_array(np.array(['bbc.co.uk', 'bbc..co.uk', 'BBC.CO.UK.']))
+    array([ True, False,  True])
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind not in "SU":
+            raise ValueError(
+                "values must be a NumPy S or U array, got {0}".format(values.dtype)
+            )
+        return _validate_fixed_width(values, allow_underscores, min_labels)
+
+    if type(values).__module__.partition(".")[0] == "pyarrow":
+        import pyarrow as pa
+
+        if isinstance(values, pa.ChunkedArray):
+            masks = [
+                _validate_arrow_chunk(chunk, pa, allow_underscores, min_labels)
+                for chunk in values.chunks
+            ]
+            return np.concatenate(masks) if masks else np.zeros(0, dtype=bool)
+        return _validate_arrow_chunk(values, pa, allow_underscores, min_labels)
+
+    raise ValueError(
+        "values must be a NumPy or Arrow array, got {0}".format(type(values))
+    )
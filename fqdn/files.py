@@ -0,0 +1,96 @@
+"""
+Validate newline-delimited files of names in place.
+
+``scan_file`` maps a file into memory one window at a time and matches each
+record where it lies, with the same bytes pattern as ``is_valid_bytes``, so no
+per-line ``str`` or ``bytes`` object is created. Each window is unmapped before
+the next is mapped, which keeps the resident memory of the scan bounded by the
+window size however large the file is.
+
+It needs Python 3, where indexing a memory map gives an int and ``array``
+has the ``'Q'`` type.
+"""
+import mmap
+import os
+from array import array
+from collections import namedtuple
+
+from fqdn import _compiled_regex
+
+WINDOW_SIZE = 64 << 20
+
+FileScan = namedtuple("FileScan", "records valid invalid invalid_offsets")
+
+
+def scan_file(path, allow_underscores=False, min_labels=2, window=WINDOW_SIZE):
+    """
+    Validate every line of the file at ``path`` as ``FQDN.is_valid`` would,
+    treating an empty line as invalid and ignoring a ``\\r`` before the
+    ``\\n``.
+
+    Returns a ``FileScan`` with the counts of ``records``, ``valid`` and
+    ``invalid`` lines, and ``invalid_offsets``, an ``array('Q')`` holding the
+    byte offset in the file where each invalid line starts.
+    """
+    match = _compiled_regex(allow_underscores, min_labels, binary=True).match
+    granularity = mmap.ALLOCATIONGRANULARITY
+    # two granules or more, so a window always holds more than the longest
+    # valid line past the start of the line it is mapped for
+    window = max(2 * granularity, window - window % granularity)
+    invalid_offsets = array("Q")
+    records = 0
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        start = 0
+        # set while skipping the rest of a line too long to fit in a window
+        skipping = False
+        while start < size:
+            map_offset = start - start % granularity
+            length = min(window, size - map_offset)
+            last = map_offset + length == size
+            mm = mmap.mmap(
+                f.fileno(), length, access=mmap.ACCESS_READ, offset=map_offset
+            )
+            try:
+                pos = start - map_offset
+                if skipping:
+                    newline = mm.find(b"\n", pos)
+                    if newline == -1:
+                        start = map_offset + length
+                        continue
+                    skipping = False
+                    pos = newline + 1
+                while pos < length:
+                    newline = mm.find(b"\n", pos)
+                    if newline == -1:
+                        if not last:
+                            break
+                        newline = length
+                    end = newline
+                    if end > pos and mm[end - 1] == 13:  # b"\r"
+                        end -= 1
+                    records += 1
+                    if end == pos:
+                        invalid_offsets.append(map_offset + pos)
+                    else:
+                        name_length = end - pos
+                        if mm[end - 1] == 46:  # b"."
+                            name_length -= 1
+                        if name_length > 253 or match(mm, pos, end) is None:
+                            invalid_offsets.append(map_offset + pos)
+                    pos = newline + 1
+
+                if pos == start - map_offset and pos < length:
+                    # no line ended in this window; a line this long is
+                    # invalid, so record it and skip to its end
+                    records += 1
+                    invalid_offsets.append(map_offset + pos)
+                    skipping = True
+                    pos = length
+                start = map_offset + pos
+            finally:
+                mm.close()
+
+    invalid = len(invalid_offsets)
+    return FileScan(records, records - invalid, invalid, invalid_offsets)
@@ -0,0 +1,122 @@
+"""
+Convert internationalized names to their ASCII form and validate them in one
+step.
+
+Encoding a whole name with the standard library ``idna`` codec and then
+building an ``FQDN`` from the result runs nameprep and punycode on every name,
+and the codec re-checks the ASCII labels as it goes. An ``IDNConverter``
+leaves ASCII names to the validator alone, and in other names only converts
+the labels that are not ASCII, each once, remembering the A-label for the
+next name that has it. Most internationalized names in a stream share labels
+such as their suffix, so after a warm-up the codec is rarely called at all.
+
+The conversion is the codec's, IDNA 2003, one label at a time with
+``encodings.idna.ToASCII``.
+
+It needs Python 3, where names are text rather than bytes.
+"""
+from collections import OrderedDict
+from encodings.idna import ToASCII, dots
+
+from fqdn import _bind_engine
+from fqdn._compat import str_isascii
+
+_MISSING = object()
+
+
+class IDNConverter:
+    """
+    Maps names, which may have U-labels, to the canonical form of their
+    A-label equivalent: the ``absolute`` form of
+    ``FQDN(name.encode("idna").decode("ascii"), **options)``, or ``relative``
+    when ``relative`` is True. Names the codec cannot encode and names that
+    are invalid once encoded map to None, and anything that is not a
+    non-empty ``str`` raises ``ValueError``, as the ``FQDN`` constructor does.
+
+    Labels are split at the same dots as the codec splits at, including the
+    ideographic full stop. The A-labels of at most ``maxsize`` U-labels are
+    kept, and the oldest is dropped first.
+
+    >>> to_ascii = IDNConverter()
+    >>> to_ascii('Bücher.example')
+    'xn--bcher-kva.example.'
+    >>> list(to_ascii.map(['www.bücher.example', 'BBC.co.uk', 'bad_name.de']))
+    ['www.xn--bcher-kva.example.', 'bbc.co.uk.', None]
+    """
+
+    def __init__(
+        self, relative=False, allow_underscores=False, min_labels=2, maxsize=65536
+    ):
+        self.relative = relative
+        self.maxsize = maxsize
+        self._is_valid = _bind_engine(None, allow_underscores, min_labels)
+        self._a_labels = OrderedDict()
+
+    def __len__(self):
+        return len(self._a_labels)
+
+    def _a_label(self, label):
+        """
+        The A-label for a label that is not ASCII, or None when the codec
+        cannot encode it.
+        """
+        a_label = self._a_labels.get(label, _MISSING)
+        if a_label is not _MISSING:
+            return a_label
+        try:
+            a_label = ToASCII(label).decode("ascii")
+        except UnicodeError:
+            a_label = None
+        a_labels = self._a_labels
+        a_labels[label] = a_label
+        if len(a_labels) > self.maxsize:
+            a_labels.popitem(last=False)
+        return a_label
+
+    def _encode(self, name):
+        labels = dots.split(name)
+        absolute = len(labels) > 1 and not labels[-1]
+        if absolute:
+            labels.pop()
+        for index, label in enumerate(labels):
+            if str_isascii(label):
+                continue
+            a_label = self._a_label(label)
+            if a_label is None:
+                return None
+            labels[index] = a_label
+        if absolute:
+            labels.append("")
+        return ".".join(labels)
+
+    def __call__(self, name):
+        """
+        The canonical A-label form of ``name``, or None when it cannot be
+        encoded or is invalid.
+        """
+        if not (name and isinstance(name, str)):
+            raise ValueError("fqdn must be str")
+        if not str_isascii(name):
+            name = self._encode(name)
+            if name is None:
+                return None
+        name = name.lower()
+        if not self._is_valid(name):
+            return None
+        if self.relative:
+            return name[:-1] if name.endswith(".") else name
+        return name if name.endswith(".") else "{0}.".format(name)
+
+    def map(self, names):
+        """
+        Yield the canonical A-label form of each name from an iterable, or
+        None for a name that cannot be encoded or is invalid, in order.
+        """
+        for name in names:
+            yield self(name)
+
+    def clear(self):
+        """
+        Forget every remembered A-label.
+        """
+        self._a_labels.clear()
@@ -0,0 +1,119 @@
+"""
+Set membership and zone matching for large collections of names.
+"""
+from fqdn import FQDN, CompactFQDN, _bind_engine
+
+
+class SuffixIndex:
+    """
+    A mapping from names, in canonical absolute form, to optional values,
+    with lookups of the longest listed zone a name falls under.
+
+    Every name added is validated with the options given here. Lookups only
+    lowercase the name and add the trailing dot; they do not validate it. An
+    exact lookup is one hash of the name. ``longest_match`` probes the name
+    at each label boundary, from the full name up to its last label, so it
+    costs one hash per label.
+
+    The index keeps one key string per entry, so it stays close to the size
+    of a ``dict`` of strings. That is far smaller than a trie of per-label
+    nodes.
+
+    >>> zones = SuffixIndex(['example.com', 'ads.example.net'])
+    >>> 'EXAMPLE.COM.' in zones
+    True
+    >>> zones.longest_match('cdn.ads.example.net')
+    'ads.example.net.'
+    >>> zones.longest_match('example.net') is None
+    True
+    """
+
+    def __init__(self, names=(), allow_underscores=False, min_labels=2):
+        self._is_valid = _bind_engine(None, allow_underscores, min_labels)
+        self._entries = {}
+        self.update(names)
+
+    def _key(self, name):
+        if isinstance(name, (FQDN, CompactFQDN)):
+            return name.absolute
+        if not (name and isinstance(name, str)):
+            raise ValueError("fqdn must be str")
+        name = name.lower()
+        return name if name.endswith(".") else "{0}.".format(name)
+
+    def _valid_key(self, name):
+        # FQDN and CompactFQDN keys are checked too, as they may have been
+        # validated with looser options than the index's
+        key = self._key(name)
+        if not self._is_valid(key):
+            raise ValueError("invalid FQDN `{0}`".format(name))
+        return key
+
+    def add(self, name, value=None):
+        """
+        Add ``name``, mapped to ``value``. Raises ``ValueError`` when the name
+        is invalid.
+        """
+        self._entries[self._valid_key(name)] = value
+
+    def update(self, names):
+        """
+        Add every name in an iterable, each mapped to None. Raises
+        ``ValueError`` when a name is invalid, before any name is added.
+        """
+        valid_key = self._valid_key
+        # validated in full first, so an invalid name leaves the index as it was
+        keys = [valid_key(name) for name in names]
+        self._entries.update(dict.fromkeys(keys))
+
+    def discard(self, name):
+        self._entries.pop(self._key(name), None)
+
+    def get(self, name, default=None):
+        return self._entries.get(self._key(name), default)
+
+    def __getitem__(self, name):
+        return self._entries[self._key(name)]
+
+    def __setitem__(self, name, value):
+        self.add(name, value)
+
+    def __delitem__(self, name):
+        del self._entries[self._key(name)]
+
+    def __contains__(self, name):
+        return self._key(name) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def longest_match(self, name):
+        """
+        The longest name in the index that is ``name`` itself or one of its
+        parent zones, in absolute form, or None.
+        """
+        key = self._key(name)
+        entries = self._entries
+        start = 0
+        end = len(key)
+        while start < end:
+            suffix = key[start:] if start else key
+            if suffix in entries:
+                return suffix
+            start = key.find(".", start) + 1
+            if not start:
+                break
+        return None
+
+    def longest_match_item(self, name, default=None):
+        """
+        ``(zone, value)`` for the ``longest_match`` of ``name``, or
+        ``default`` when no zone matches.
+        """
+        zone = self.longest_match(name)
+        if zone is None:
+            return default
+        return zone, self._entries[zone]
@@ -0,0 +1,119 @@
+"""
+Canonicalize streams of names in which the same few names repeat.
+
+A ``Normalizer`` maps each raw name to its canonical absolute or relative
+form, and remembers the answer for the raw string, so a name seen before,
+in the same case and with or without the same trailing dot, costs one dict
+lookup. It can also drop every occurrence of a canonical name after the
+first.
+"""
+from collections import OrderedDict
+
+from fqdn import _bind_engine
+from fqdn._compat import move_to_end
+
+_MISSING = object()
+
+
+class Normalizer:
+    """
+    Maps raw names to the canonical form of ``FQDN(name, **options)``:
+    ``absolute``, or ``relative`` when ``relative`` is True. Invalid names map
+    to None, and anything that is not a non-empty ``str`` raises
+    ``ValueError``, as the constructor does.
+
+    Answers are memoized by the raw string. At most ``maxsize`` are kept,
+    and the oldest is dropped first. The canonical names ``unique`` has
+    already emitted are held separately, up to ``seen_maxsize`` of them,
+    dropping the least recently seen first.
+
+    >>> normalize = Normalizer()
+    >>> list(normalize.map(['BBC.co.uk', 'bbc.co.uk.', 'bbc..co.uk']))
+    ['bbc.co.uk.', 'bbc.co.uk.', None]
+    >>> list(normalize.unique(['BBC.co.uk', 'www.bbc.co.uk', 'bbc.co.uk.']))
+    ['bbc.co.uk.', 'www.bbc.co.uk.']
+    """
+
+    def __init__(
+        self,
+        relative=False,
+        allow_underscores=False,
+        min_labels=2,
+        maxsize=65536,
+        seen_maxsize=65536,
+    ):
+        self.relative = relative
+        self.maxsize = maxsize
+        self.seen_maxsize = seen_maxsize
+        self._is_valid = _bind_engine(None, allow_underscores, min_labels)
+        self._memo = OrderedDict()
+        self._seen = OrderedDict()
+
+    def __len__(self):
+        return len(self._memo)
+
+    def _normalize(self, name):
+        if not (name and isinstance(name, str)):
+            raise ValueError("fqdn must be str")
+        lowered = name.lower()
+        if not self._is_valid(lowered):
+            canonical = None
+        elif self.relative:
+            canonical = lowered[:-1] if lowered.endswith(".") else lowered
+        else:
+            canonical = lowered if lowered.endswith(".") else "{0}.".format(lowered)
+        memo = self._memo
+        memo[name] = canonical
+        if len(memo) > self.maxsize:
+            memo.popitem(last=False)
+        return canonical
+
+    def __call__(self, name):
+        """
+        The canonical form of ``name``, or None when it is invalid.
+        """
+        canonical = self._memo.get(name, _MISSING)
+        if canonical is _MISSING:
+            return self._normalize(name)
+        return canonical
+
+    def map(self, names):
+        """
+        Yield the canonical form of each name from an iterable, or None for
+        an invalid name, in order.
+        """
+        memo = self._memo
+        normalize = self._normalize
+        for name in names:
+            try:
+                yield memo[name]
+            except KeyError:
+                yield normalize(name)
+
+    def unique(self, names):
+        """
+        Yield the canonical form of each valid name from an iterable the
+        first time it appears, in order. Names are remembered across calls
+        until ``clear``, but once more than ``seen_maxsize`` different names
+        have been emitted, a name that has not appeared for a while can be
+        emitted again.
+        """
+        seen = self._seen
+        seen_maxsize = self.seen_maxsize
+        for canonical in self.map(names):
+            if canonical is None:
+                continue
+            if canonical in seen:
+                move_to_end(seen, canonical)
+                continue
+            seen[canonical] = None
+            if len(seen) > seen_maxsize:
+                seen.popitem(last=False)
+            yield canonical
+
+    def clear(self):
+        """
+        Forget every memoized answer and every name ``unique`` has emitted.
+        """
+        self._memo.clear()
+        self._seen.clear()
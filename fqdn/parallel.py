@@ -0,0 +1,116 @@
+"""
+Validate large inputs on several cores.
+
+``validate_parallel`` splits an iterable of names into chunks and runs
+``validate_many`` on each one in a pool of worker processes, so the results
+are exactly those of ``FQDN.is_valid``. Only a few chunks per worker are in
+flight at any time, so the input can be a generator over far more names than
+fit in memory.
+
+It needs Python 3, for ``concurrent.futures``.
+"""
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from fqdn import validate_many
+
+
+def _chunks(fqdns, chunksize):
+    iterator = iter(fqdns)
+    offset = 0
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield offset, chunk
+        offset += len(chunk)
+
+
+def validate_parallel(
+    fqdns,
+    allow_underscores=False,
+    min_labels=2,
+    workers=None,
+    chunksize=65536,
+    ordered=True,
+    executor=None,
+):
+    """
+    Validate an iterable of strings in a pool of ``workers`` processes,
+    defaulting to one per CPU.
+
+    Returns an iterator of ``(offset, results)`` pairs, where ``results`` is
+    the ``validate_many`` bytearray for the ``chunksize`` names starting at
+    ``offset`` in the input. With ``ordered=False`` chunks are yielded as soon
+    as they finish, which keeps every worker busy when some chunks are slower
+    than others.
+
+    Pass an ``executor`` to reuse a pool across calls; otherwise one is
+    created and shut down when the iterator finishes or is closed. Two chunks
+    per worker are in flight at a time, with the number of workers taken from
+    ``workers`` or else ``os.cpu_count()``, so pass the pool size as
+    ``workers`` along with an ``executor`` that has fewer workers than CPUs.
+
+    Raises ``ValueError`` straight away when ``chunksize`` is less than 1.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    return _validate_parallel(
+        fqdns,
+        allow_underscores,
+        min_labels,
+        workers,
+        chunksize,
+        ordered,
+        executor,
+        max_pending,
+    )
+
+
+def _validate_parallel(
+    fqdns,
+    allow_underscores,
+    min_labels,
+    workers,
+    chunksize,
+    ordered,
+    executor,
+    max_pending,
+):
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    chunks = _chunks(fqdns, chunksize)
+    # (offset, future) pairs in input order, or offsets keyed by future
+    pending = deque() if ordered else {}
+
+    def submit(offset, chunk):
+        future = executor.submit(validate_many, chunk, allow_underscores, min_labels)
+        if ordered:
+            pending.append((offset, future))
+        else:
+            pending[future] = offset
+
+    try:
+        for offset, chunk in islice(chunks, max_pending):
+            submit(offset, chunk)
+        while pending:
+            if ordered:
+                done = (pending.popleft(),)
+            else:
+                futures, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [(pending.pop(future), future) for future in futures]
+            for offset, future in done:
+                results = future.result()
+                for next_offset, chunk in islice(chunks, 1):
+                    submit(next_offset, chunk)
+                yield offset, results
+    finally:
+        futures = pending if not ordered else [future for _, future in pending]
+        for future in futures:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True)
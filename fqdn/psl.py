@@ -0,0 +1,258 @@
+"""
+Public suffixes and registrable domains from a local copy of the Public
+Suffix List, https://publicsuffix.org/list/.
+
+Nothing is fetched: the list is read from a file, such as the
+``public_suffix_list.dat`` that many systems ship in
+``/usr/share/publicsuffix``, and can be saved as a precompiled index that
+loads faster than the list can be parsed.
+"""
+import io
+import json
+import os
+
+from fqdn import FQDN, CompactFQDN
+
+_RULE = 1
+_WILDCARD = 2
+_EXCEPTION = 4
+
+# bumped whenever the layout of a saved index changes
+_CACHE_VERSION = 2
+
+# the errors a missing, unreadable or corrupt cache raises; IOError is not an
+# OSError on Python 2
+_CACHE_ERRORS = (IOError, OSError, ValueError)
+
+# os.replace is Python 3 only; os.rename also replaces the target on POSIX
+_replace = getattr(os, "replace", os.rename)
+
+
+def _forms(rule):
+    """
+    The rule as written and, for an internationalized rule, in the ASCII
+    form that names take in DNS.
+    """
+    yield rule
+    try:
+        ascii_rule = rule.encode("idna").decode("ascii")
+    except UnicodeError:
+        return
+    if ascii_rule != rule:
+        yield ascii_rule
+
+
+def _parse(lines, private):
+    index = {}
+    in_private = False
+    for line in lines:
+        line = line.strip()
+        if line.startswith("//"):
+            if "===BEGIN PRIVATE DOMAINS===" in line:
+                in_private = True
+            elif "===END PRIVATE DOMAINS===" in line:
+                in_private = False
+            continue
+        if not line or (in_private and not private):
+            continue
+        # a rule is the line up to the first whitespace
+        rule = line.split()[0].lower()
+        if rule.startswith("!"):
+            rule, flag = rule[1:], _EXCEPTION
+        elif rule.startswith("*."):
+            rule, flag = rule[2:], _WILDCARD
+        else:
+            flag = _RULE
+        for form in _forms(rule):
+            index[form] = index.get(form, 0) | flag
+            # every shorter suffix is in the index too, so that a lookup
+            # can stop at the first suffix that is not
+            start = form.find(".") + 1
+            while start:
+                index.setdefault(form[start:], 0)
+                start = form.find(".", start) + 1
+    return index
+
+
+def _load(path, key):
+    """
+    The index saved at ``path`` under ``key``, or None when there is no
+    usable one. A missing, unreadable, corrupt or stale cache is not an
+    error, as the list can always be parsed again.
+    """
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+    except _CACHE_ERRORS:
+        return None
+    # JSON has no tuples, so the key comes back as a list
+    if not (isinstance(cached, list) and len(cached) == 2):
+        return None
+    cached_key, index = cached
+    if cached_key != list(key) or not isinstance(index, dict):
+        return None
+    if not all(type(flags) is int for flags in index.values()):
+        return None
+    return index
+
+
+def _save(path, key, index):
+    """
+    Save ``index`` at ``path``, if possible. It is written to a temporary file
+    first, so that a reader never sees a partly written cache, and the
+    temporary file is removed if anything fails.
+    """
+    temporary = "{0}.{1}.tmp".format(path, os.getpid())
+    try:
+        with open(temporary, "w") as f:
+            json.dump([key, index], f, separators=(",", ":"))
+        _replace(temporary, path)
+    except _CACHE_ERRORS:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+
+
+class PublicSuffixList(object):
+    """
+    The public suffix (eTLD) and registrable domain (eTLD+1) of names, by the
+    rules of the Public Suffix List, given as the lines of the list file.
+    Rules in the private domains section are used unless ``private`` is
+    False.
+
+    The rules are held in one dict keyed on each suffix, and a lookup probes
+    the name at each label boundary from the right, stopping at the first
+    suffix no rule ends with, so it costs at most one hash per label.
+
+    Names can be an ``FQDN`` or ``CompactFQDN``, which must be valid, or a
+    ``str``, which is lowercased and has its trailing dot removed but is not
+    validated. Results are in relative form. On Python 2, where ``str`` is
+    bytes, internationalized names must be given in their ASCII form.
+
+    >>> psl = PublicSuffixList(['uk', 'co.uk', '*.ck', '!www.ck'])
+    >>> psl.public_suffix('www.BBC.co.uk.')
+    'co.uk'
+    >>> psl.registrable_domain('www.bbc.co.uk')
+    'bbc.co.uk'
+    >>> psl.split('a.b.ck'), psl.split('www.ck')
+    (('b.ck', 'a.b.ck'), ('ck', 'www.ck'))
+    >>> psl.registrable_domain('co.uk') is None
+    True
+    """
+
+    def __init__(self, lines=(), private=True):
+        self._index = _parse(lines, private)
+
+    @classmethod
+    def from_file(cls, path, private=True, cache=None):
+        """
+        Load the list file at ``path``, which is UTF-8.
+
+        When ``cache`` is a path, the parsed index is saved there, and read
+        back instead of parsing the list as long as the list file has the
+        same size and modification time. The cache is best effort: when it
+        cannot be read or written, the list is parsed as if there were none.
+        It is saved as JSON.
+        """
+        stat = os.stat(path)
+        # st_mtime_ns is Python 3 only
+        mtime = getattr(stat, "st_mtime_ns", stat.st_mtime)
+        key = (_CACHE_VERSION, stat.st_size, mtime, bool(private))
+        if cache is not None:
+            index = _load(cache, key)
+            if index is not None:
+                psl = cls.__new__(cls)
+                psl._index = index
+                return psl
+        with io.open(path, encoding="utf-8") as f:
+            psl = cls(f, private=private)
+        if cache is not None:
+            _save(cache, key, psl._index)
+        return psl
+
+    def __len__(self):
+        return len(self._index)
+
+    def _key(self, name):
+        if isinstance(name, (FQDN, CompactFQDN)):
+            return name.relative
+        if not (name and isinstance(name, str)):
+            raise ValueError("fqdn must be str")
+        name = name.lower()
+        return name[:-1] if name.endswith(".") else name
+
+    def _suffix_start(self, key):
+        """
+        The offset in ``key`` where its public suffix starts.
+        """
+        index = self._index
+        # with no matching rule, the default rule "*" makes the last label
+        # the public suffix
+        suffix_start = key.rfind(".") + 1
+        end = len(key)
+        while True:
+            start = key.rfind(".", 0, end) + 1
+            flags = index.get(key[start:] if start else key)
+            if flags is None:
+                break
+            if flags & _EXCEPTION:
+                # an exception rule's public suffix is the rule without its
+                # first label
+                return key.find(".", start) + 1
+            if flags & _RULE:
+                suffix_start = start
+            if flags & _WILDCARD and start:
+                suffix_start = key.rfind(".", 0, start - 1) + 1
+            if not start:
+                break
+            end = start - 1
+        return suffix_start
+
+    def public_suffix(self, name):
+        """
+        The public suffix of ``name``.
+        """
+        key = self._key(name)
+        return key[self._suffix_start(key) :]
+
+    def registrable_domain(self, name):
+        """
+        The public suffix of ``name`` with one more label, or None when the
+        name is itself a public suffix.
+        """
+        key = self._key(name)
+        suffix_start = self._suffix_start(key)
+        if not suffix_start:
+            return None
+        return key[key.rfind(".", 0, suffix_start - 1) + 1 :]
+
+    def split(self, name):
+        """
+        ``(public_suffix, registrable_domain)`` for ``name``, from a single
+        lookup.
+        """
+        key = self._key(name)
+        suffix_start = self._suffix_start(key)
+        if not suffix_start:
+            return key, None
+        return key[suffix_start:], key[key.rfind(".", 0, suffix_start - 1) + 1 :]
+
+    def registrable_domains(self, names):
+        """
+        A list of the ``registrable_domain`` of each name, in order. Each
+        distinct name is only looked up once.
+        """
+        results = {}
+        registrable_domain = self.registrable_domain
+        domains = []
+        append = domains.append
+        for name in names:
+            try:
+                append(results[name])
+            except (KeyError, TypeError):
+                domain = registrable_domain(name)
+                if isinstance(name, str):
+                    results[name] = domain
+                append(domain)
+        return domains
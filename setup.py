@@ -14,9 +14,13 @@ setup(
     keywords=["fqdn", "domain", "hostname", "RFC3686", "dns"],
     license="MPL 2.0",
     zip_safe=True,
-    install_requires=["cached-property>=1.3.0;python_version<'3.8'"],
     python_requires=">=2.7, !=3.0, !=3.1, !=3.2, !=3.3, !=3.4, <4",
     test_suite="tests",
+    # registered on every version, as this runs on the interpreter that
+    # builds the package rather than the one that installs it; the command
+    # itself exits with an error on Python 2
+    entry_points={"console_scripts": ["fqdn=fqdn.__main__:main"]},
+    extras_require={"numpy": ["numpy"], "arrow": ["numpy", "pyarrow"]},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Environment :: Web Environment",
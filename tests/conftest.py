@@ -0,0 +1,13 @@
+import sys
+
+collect_ignore = []
+# fqdn.aio and its tests use async syntax, which needs Python 3.5
+if sys.version_info < (3, 5):
+    collect_ignore.append("test_aio.py")
+# fqdn.parallel needs concurrent.futures, the command line validator binary
+# stdio, fqdn.idn names that are text, and fqdn.files int items from mmap and
+# array('Q'), none of which Python 2 has
+if sys.version_info < (3, 0):
+    collect_ignore.extend(
+        ["test_files.py", "test_idn.py", "test_main.py", "test_parallel.py"]
+    )
@@ -0,0 +1,102 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fqdn import validate_many
+from fqdn.aio import validate_stream
+
+NAMES = ["host{0}.example.com".format(i) for i in range(20)] + [
+    "trainwreck..",
+    "o_o.dog",
+    "label",
+] * 3
+
+
+class AsyncNames:
+    """
+    An async iterator over ``names``, without the async generator syntax of
+    Python 3.6.
+    """
+
+    def __init__(self, names):
+        self._names = iter(names)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._names)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def run(coroutine):
+    # asyncio.run needs Python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def collect(names, **kwargs):
+    async def main():
+        pairs = []
+        async for pair in validate_stream(AsyncNames(names), **kwargs):
+            pairs.append(pair)
+        return pairs
+
+    return run(main())
+
+
+def expected(names, **kwargs):
+    return list(zip(names, map(bool, validate_many(names, **kwargs))))
+
+
+@pytest.mark.parametrize("batch_size", (1, 7, 1024))
+def test_inline(batch_size):
+    assert collect(NAMES, batch_size=batch_size) == expected(NAMES)
+
+
+def test_options():
+    pairs = collect(NAMES, allow_underscores=True, min_labels=1, batch_size=5)
+    assert pairs == expected(NAMES, allow_underscores=True, min_labels=1)
+
+
+@pytest.mark.parametrize("offload_size", (None, 5, 100))
+def test_executor(offload_size):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pairs = collect(
+            NAMES, batch_size=8, executor=executor, offload_size=offload_size
+        )
+    assert pairs == expected(NAMES)
+
+
+def test_empty():
+    assert collect([]) == []
+
+
+def test_yields_to_event_loop():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        async for _ in validate_stream(AsyncNames(NAMES * 10), batch_size=10):
+            pass
+        task.cancel()
+
+    run(main())
+    assert len(ticks) >= len(NAMES * 10) // 10
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        collect(["a.com", None])
+    with pytest.raises(ValueError):
+        collect(NAMES, batch_size=0)
@@ -0,0 +1,171 @@
+# coding=utf-8
+"""
+``validate_array`` must agree with the scalar path on every row.
+"""
+import random
+
+import pytest
+from fqdn import FQDN, is_valid_bytes
+
+np = pytest.importorskip("numpy")
+arrays = pytest.importorskip("fqdn.arrays")
+
+ALPHABET = "abcXYZ019-._ é\u212aİ"
+
+NAMES = [
+    "trainwreck.com",
+    "trainwreck.com.",
+    "TRAINWRECK.COM",
+    "trainwreck..",
+    "label",
+    "label.",
+    ".",
+    "..",
+    "-",
+    "-a.com",
+    "a-.com",
+    "a.-b",
+    "a.b-",
+    "a.b-.",
+    "o_o.dog",
+    "le-tour-est-joué.com",
+    "\u212a.com",  # KELVIN SIGN, lowercased to k
+    "İ.com",
+    "a b.com",
+    "a" * 63 + ".com",
+    "a" * 64 + ".com",
+    "com." + "b" * 64,
+    ".".join(["a" * 63] * 3 + ["a" * 61]),
+    ".".join(["a" * 63] * 3 + ["a" * 61]) + ".",
+    ".".join(["a" * 63] * 3 + ["a" * 62]),
+    ".".join("a" * 127),
+    ".".join("a" * 128),
+]
+
+
+def random_names(seed, count=2000):
+    rng = random.Random(seed)
+    names = []
+    for _ in range(count):
+        if rng.random() < 0.6:
+            size = rng.randint(1, 12)
+            names.append("".join(rng.choice(ALPHABET) for _ in range(size)))
+        else:
+            labels = [
+                "".join(rng.choice("ab-_") for _ in range(rng.randint(0, 66)))
+                for _ in range(rng.randint(1, 8))
+            ]
+            names.append(".".join(labels) + rng.choice(("", ".", "..")))
+    return names
+
+
+def expected(names, **kwargs):
+    return [bool(name) and FQDN(name, **kwargs).is_valid for name in names]
+
+
+@pytest.fixture(params=(True, False))
+def a_u(request):
+    return request.param
+
+
+@pytest.fixture(params=(1, 2, 3))
+def min_labels(request):
+    return request.param
+
+
+@pytest.fixture
+def pa():
+    # skips only the tests that need it, rather than the whole module
+    return pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(params=(1 << 22, 64))
+def block_size(request, monkeypatch):
+    # a small block puts names at the edges of several blocks
+    monkeypatch.setattr(arrays, "BLOCK_SIZE", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_unicode_array(seed, a_u, min_labels, block_size):
+    names = NAMES + random_names(seed)
+    kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+    mask = arrays.validate_array(np.array(names), **kwargs)
+    assert mask.dtype == bool
+    assert mask.tolist() == expected(names, **kwargs)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_bytes_array(seed, a_u, min_labels, block_size):
+    names = [
+        name.encode("utf-8") for name in NAMES + random_names(seed) if name.strip()
+    ]
+    kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+    mask = arrays.validate_array(np.array(names), **kwargs)
+    assert mask.tolist() == [is_valid_bytes(name, **kwargs) for name in names]
+
+
+@pytest.mark.parametrize("min_labels", (1.5, 2.0, 3.5, float("inf"), float("nan")))
+def test_non_integer_min_labels(a_u, min_labels):
+    kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+    mask = arrays.validate_array(np.array(NAMES), **kwargs)
+    assert mask.tolist() == expected(NAMES, **kwargs)
+
+
+def test_shape_and_empty():
+    names = np.array([["bbc.co.uk", ""], ["", "bbc..co.uk"]])
+    assert arrays.validate_array(names).tolist() == [[True, False], [False, False]]
+    assert arrays.validate_array(np.array([], dtype="U1")).shape == (0,)
+    assert arrays.validate_array(np.array(["", ""])).tolist() == [False, False]
+
+
+def test_embedded_nul():
+    names = np.array(["bbc\x00.co.uk", "bbc.co.uk\x00"])
+    assert arrays.validate_array(names).tolist() == [False, True]
+
+
+def test_rejects_other_arrays():
+    with pytest.raises(ValueError):
+        arrays.validate_array(np.array([1, 2]))
+    with pytest.raises(ValueError):
+        arrays.validate_array(["bbc.co.uk"])
+
+
+class TestArrow:
+    @pytest.mark.parametrize("type_", ("string", "large_string"))
+    def test_matches_scalar(self, pa, type_, a_u, min_labels, block_size):
+        names = NAMES + random_names(0)
+        kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+        column = pa.array(names, type=getattr(pa, type_)())
+        mask = arrays.validate_array(column, **kwargs)
+        assert mask.tolist() == expected(names, **kwargs)
+
+    def test_nulls_and_slices(self, pa, block_size):
+        names = ["bbc.co.uk", None, "", "bbc..co.uk", "\u212a.com", None, "a.b"]
+        column = pa.array(names)
+        assert arrays.validate_array(column).tolist() == [
+            True,
+            False,
+            False,
+            False,
+            True,
+            False,
+            True,
+        ]
+        assert arrays.validate_array(column.slice(3, 3)).tolist() == [
+            False,
+            True,
+            False,
+        ]
+        assert arrays.validate_array(pa.array([None, ""])).tolist() == [
+            False,
+            False,
+        ]
+
+    def test_chunked(self, pa):
+        column = pa.chunked_array([["bbc.co.uk"], [], ["bbc..co.uk", "a.b"]])
+        assert arrays.validate_array(column).tolist() == [True, False, True]
+
+    def test_rejects_other_types(self, pa):
+        with pytest.raises(ValueError):
+            arrays.validate_array(pa.array([1, 2]))
@@ -0,0 +1,76 @@
+import mmap
+
+import pytest
+from fqdn import validate_many
+from fqdn.files import scan_file
+
+GRANULE = mmap.ALLOCATIONGRANULARITY
+
+
+def write_lines(tmp_path, lines, ending=b"\n"):
+    path = tmp_path / "names.txt"
+    path.write_bytes(ending.join(lines))
+    return str(path)
+
+
+def expected_offsets(lines, ending=b"\n", **kwargs):
+    names = [line.decode("ascii") or "." for line in lines]
+    results = validate_many(names, **kwargs)
+    offsets, offset = [], 0
+    for line, valid in zip(lines, results):
+        if not valid:
+            offsets.append(offset)
+        offset += len(line) + len(ending)
+    return offsets
+
+
+LINES = [b"trainwreck.com", b"TRAINWRECK.COM.", b"", b"trainwreck..", b"o_o.dog"]
+
+
+@pytest.mark.parametrize("ending", (b"\n", b"\r\n"))
+def test_counts_and_offsets(tmp_path, ending):
+    path = write_lines(tmp_path, LINES, ending)
+    scan = scan_file(path)
+    assert scan.records == 5
+    assert scan.valid == 2
+    assert scan.invalid == 3
+    assert list(scan.invalid_offsets) == expected_offsets(LINES, ending)
+
+
+def test_trailing_newline_is_not_a_record(tmp_path):
+    path = write_lines(tmp_path, LINES + [b""])
+    assert scan_file(path).records == 5
+
+
+def test_options(tmp_path):
+    path = write_lines(tmp_path, LINES + [b"label"])
+    scan = scan_file(path, allow_underscores=True, min_labels=1)
+    assert scan.valid == 4
+    assert list(scan.invalid_offsets) == expected_offsets(
+        LINES + [b"label"], allow_underscores=True, min_labels=1
+    )
+
+
+def test_empty_file(tmp_path):
+    scan = scan_file(write_lines(tmp_path, []))
+    assert scan[:3] == (0, 0, 0)
+    assert not scan.invalid_offsets
+
+
+def test_lines_across_windows(tmp_path):
+    lines = [
+        "host{0}.{1}.example.com".format(i, "-" if i % 7 == 0 else "zone").encode()
+        for i in range(3 * GRANULE // 10)
+    ]
+    path = write_lines(tmp_path, lines)
+    scan = scan_file(path, window=2 * GRANULE)
+    assert scan.records == len(lines)
+    assert list(scan.invalid_offsets) == expected_offsets(lines)
+
+
+def test_line_longer_than_window(tmp_path):
+    lines = [b"a.com", b"b" * (5 * GRANULE), b"c.com", b"d" * (3 * GRANULE)]
+    path = write_lines(tmp_path, lines)
+    scan = scan_file(path, window=2 * GRANULE)
+    assert scan.records == 4
+    assert list(scan.invalid_offsets) == [6, 7 + 5 * GRANULE + 6]
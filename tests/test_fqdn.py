@@ -1,8 +1,11 @@
 # coding=utf-8
+import subprocess
 import sys
 
+import fqdn
 import pytest
-from fqdn import FQDN
+from fqdn import FQDN, CompactFQDN, InternTable, validate_many
+from fqdn._compat import str_isascii
 
 
 @pytest.fixture(params=(True, False))
@@ -10,6 +13,12 @@ def a_u(request):
     return request.param
 
 
+@pytest.fixture(autouse=True, params=("regex", "scanner"))
+def engine(request, monkeypatch):
+    monkeypatch.setattr(fqdn, "_DEFAULT_ENGINE", request.param)
+    return request.param
+
+
 class TestFQDNValidation:
     def test_constructor(self, a_u):
         with pytest.raises(ValueError):
@@ -109,6 +118,14 @@ class TestFQDNValidation:
             "sh4d05-7357", "c00-mm", allow_underscores=a_u
         )
 
+    def test_rfc_3696_s_2__preferred_form_invalid_digits(self, a_u):
+        self.__assert_invalid_fwd_and_bkwd_from_seq("٣", "com", allow_underscores=a_u)
+        self.__assert_invalid_fwd_and_bkwd_from_seq("x", "１", allow_underscores=a_u)
+
+    def test_trailing_newline_is_invalid(self, a_u):
+        assert not FQDN("trainwreck.com\n", allow_underscores=a_u).is_valid
+        assert not FQDN("trainwreck.com.\n", allow_underscores=a_u).is_valid
+
     def test_rfc_1035_s_2_3_1__label_can_have_inital_digit(self, a_u):
         self.__assert_valid_fwd_and_bkwd_from_seq("www", "1", allow_underscores=a_u)
         self.__assert_valid_fwd_and_bkwd_from_seq("1w", "1", allow_underscores=a_u)
@@ -144,6 +161,17 @@ class TestFQDNValidation:
         return FQDN(fqdn, **kwargs).is_valid
 
 
+class TestEngine:
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            FQDN("trainwreck.com", engine="nope")
+
+    @pytest.mark.parametrize("name", ("regex", "scanner"))
+    def test_explicit_engine(self, a_u, name):
+        assert FQDN("trainwreck.com", engine=name, allow_underscores=a_u).is_valid
+        assert not FQDN("trainwreck..", engine=name, allow_underscores=a_u).is_valid
+
+
 class TestMinLabels:
     def test_labels_count(self, a_u):
         assert FQDN("label").labels_count == 1
@@ -287,3 +315,657 @@ class TestHash:
         assert hash(FQDN("trainwreck.com.", allow_underscores=False)) == hash(
             FQDN("trainwreck.com", allow_underscores=True)
         )
+
+
+class TestCompiledRegex:
+    def test_pattern_is_compiled_once(self, a_u):
+        first = FQDN("trainwreck.com", allow_underscores=a_u)._regex
+        second = FQDN("other.org", allow_underscores=a_u)._regex
+        assert first is second
+
+    def test_pattern_per_option_combination(self):
+        assert FQDN("a.b")._regex is not FQDN("a.b", allow_underscores=True)._regex
+        assert FQDN("a.b")._regex is not FQDN("a.b", min_labels=3)._regex
+
+    def test_min_labels_folded_into_pattern(self, a_u):
+        regex = FQDN("a.b.c", min_labels=3, allow_underscores=a_u)._regex
+        assert regex.match("a.b.c")
+        assert regex.match("a.b.c.")
+        assert not regex.match("a.b")
+        assert not regex.match("a.b.")
+
+    def test_float_min_labels(self, monkeypatch):
+        # a float first, so a pattern for it would be cached under the
+        # default key
+        monkeypatch.setattr(fqdn, "_REGEX_CACHE", {})
+        monkeypatch.setattr(fqdn, "_BOUND_ENGINES", {})
+        assert FQDN("a.com", min_labels=2.0).is_valid
+        assert not FQDN("a.b.com", min_labels=3.5).is_valid
+        assert FQDN("a.b.c.com", min_labels=3.5).is_valid
+        assert FQDN("www.example.com").is_valid
+        assert fqdn.is_valid_fqdn("www.example.com")
+        assert list(fqdn.validate_many(["www.example.com"])) == [True]
+
+    @pytest.mark.parametrize(
+        "min_labels", (128, 2 ** 32, 10 ** 100, float("inf"), float("nan"))
+    )
+    def test_min_labels_beyond_any_name(self, a_u, min_labels):
+        name = ".".join("a" for _ in range(127))
+        assert not FQDN(name, allow_underscores=a_u, min_labels=min_labels).is_valid
+        assert FQDN(name, allow_underscores=a_u, min_labels=127).is_valid
+        result = fqdn.validate(name, allow_underscores=a_u, min_labels=min_labels)
+        assert result.code == "too_few_labels"
+
+
+class TestValidateMany:
+    names = (
+        "trainwreck.com",
+        "trainwreck.com.",
+        "TRAINWRECK.COM",
+        "trainwreck..",
+        "label",
+        "-a.com",
+        "a-.com",
+        "o_o.dog",
+        "fable.label.babel",
+        "le-tour-est-joué.com",
+        "İ.com",
+        "\u212a.com",  # KELVIN SIGN, lowercased to k
+        "A" * 64 + ".com",
+        ".".join("ab" for _ in range(85)),
+    )
+
+    @pytest.mark.parametrize("min_labels", (1, 2, 3))
+    def test_matches_fqdn_is_valid(self, a_u, min_labels):
+        kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+        expected = [FQDN(name, **kwargs).is_valid for name in self.names]
+        assert list(map(bool, validate_many(self.names, **kwargs))) == expected
+
+    def test_returns_bytearray(self):
+        results = validate_many(iter(["trainwreck.com", "trainwreckcom"]))
+        assert results == bytearray([1, 0])
+
+    def test_empty_input(self):
+        assert validate_many([]) == bytearray()
+
+    def test_raises_like_constructor(self):
+        with pytest.raises(ValueError):
+            validate_many(["trainwreck.com", ""])
+        with pytest.raises(ValueError):
+            validate_many(["trainwreck.com"], engine="nope")
+        with pytest.raises(ValueError):
+            validate_many([None])
+
+
+class TestValidate:
+    @pytest.mark.parametrize("min_labels", (1, 2, 3))
+    def test_matches_fqdn_is_valid(self, a_u, min_labels):
+        kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+        for name in TestValidateMany.names:
+            result = fqdn.validate(name, **kwargs)
+            assert bool(result) == FQDN(name, **kwargs).is_valid, name
+            assert result == FQDN(name, **kwargs).validation_result
+
+    def test_valid_is_singleton(self):
+        assert fqdn.validate("trainwreck.com") is fqdn.VALID
+        assert fqdn.validate("TRAINWRECK.COM.") is fqdn.VALID
+        assert FQDN("trainwreck.com").validation_result is fqdn.VALID
+        assert fqdn.VALID.label is None and fqdn.VALID.offset is None
+
+    @pytest.mark.parametrize(
+        "name,code,label,offset",
+        (
+            ("a" * 250 + ".com", "too_long", 1, 253),
+            ("trainwreck.c m", "bad_character", 1, 12),
+            ("o_o.dog", "bad_character", 0, 1),
+            ("trainwreck..com", "empty_label", 1, 11),
+            (".trainwreck.com", "empty_label", 0, 0),
+            ("a." + "b" * 64 + ".com", "label_too_long", 1, 65),
+            ("trainwreck.-com", "leading_hyphen", 1, 11),
+            ("trainwreck-.com", "trailing_hyphen", 0, 10),
+            ("trainwreck", "too_few_labels", 1, 10),
+            ("trainwreck.", "too_few_labels", 1, 11),
+        ),
+    )
+    def test_reasons(self, name, code, label, offset):
+        result = fqdn.validate(name)
+        assert not result
+        assert (result.code, result.label, result.offset) == (code, label, offset)
+        assert result == fqdn.ValidationResult(code, label, offset)
+
+    def test_first_failure_is_reported(self):
+        result = fqdn.validate("a-.b.a-.-c.com")
+        assert (result.code, result.label) == ("trailing_hyphen", 0)
+        result = fqdn.validate("ok.a-.ok.a-.com")
+        assert (result.code, result.label, result.offset) == (
+            "trailing_hyphen",
+            1,
+            4,
+        )
+
+    def test_raises_like_constructor(self):
+        with pytest.raises(ValueError):
+            fqdn.validate("")
+        with pytest.raises(ValueError):
+            fqdn.validate(None)
+
+
+class TestIsValidFQDN:
+    @pytest.mark.parametrize("min_labels", (1, 2, 3))
+    def test_matches_fqdn(self, a_u, min_labels):
+        kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+        for name in TestValidateMany.names:
+            f = FQDN(name, **kwargs)
+            assert fqdn.is_valid_fqdn(name, **kwargs) is f.is_valid, name
+            assert fqdn.is_valid_fqdn(name, absolute=True, **kwargs) is (
+                f.is_valid_absolute
+            ), name
+            assert fqdn.is_valid_fqdn(name, absolute=False, **kwargs) is (
+                f.is_valid_relative
+            ), name
+
+    def test_follows_default_engine(self, engine):
+        fqdn.is_valid_fqdn("trainwreck.com")
+        assert (engine, False, 2) in fqdn._BOUND_ENGINES
+
+    def test_raises_like_constructor(self):
+        names = ["", None]
+        if sys.version_info >= (3, 0):
+            # bytes are str on Python 2
+            names.append(b"trainwreck.com")
+        for name in names:
+            with pytest.raises(ValueError):
+                fqdn.is_valid_fqdn(name)
+
+
+class TestValidator:
+    @pytest.mark.parametrize("min_labels", (1, 2, 3))
+    def test_matches_fqdn(self, a_u, min_labels):
+        kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+        validator = fqdn.Validator(**kwargs)
+        names = TestValidateMany.names
+        absolutes = []
+        for name in names:
+            f = FQDN(name, **kwargs)
+            assert validator.is_valid(name) is f.is_valid, name
+            if f.is_valid:
+                assert validator.absolute(name) == f.absolute
+                assert validator.relative(name) == f.relative
+            else:
+                with pytest.raises(ValueError):
+                    validator.absolute(name)
+                with pytest.raises(ValueError):
+                    validator.relative(name)
+            absolutes.append(f.absolute if f.is_valid else None)
+        assert validator.validate_many(names) == validate_many(names, **kwargs)
+        assert validator.absolute_many(iter(names)) == absolutes
+
+    def test_engine(self):
+        assert fqdn.Validator(engine="scanner").is_valid("trainwreck.com")
+        with pytest.raises(ValueError):
+            fqdn.Validator(engine="nope")
+
+    def test_raises_like_constructor(self):
+        validator = fqdn.Validator()
+        names = ["", None]
+        if sys.version_info >= (3, 0):
+            # bytes are str on Python 2
+            names.append(b"trainwreck.com")
+        for method in (
+            validator.is_valid,
+            validator.absolute,
+            validator.relative,
+            lambda name: validator.validate_many([name]),
+            lambda name: validator.absolute_many([name]),
+        ):
+            for name in names:
+                with pytest.raises(ValueError):
+                    method(name)
+
+
+class TestChildAndParent:
+    def test_child(self, a_u):
+        zone = FQDN("Example.com.", allow_underscores=a_u)
+        child = zone.child("SVC").child("host")
+        assert child.absolute == "host.svc.example.com."
+        assert child.is_valid_absolute
+        assert child == FQDN("host.svc.example.com")
+        assert FQDN("example.com").child("www").relative == "www.example.com"
+
+    def test_child_keeps_options(self):
+        zone = FQDN("com", min_labels=1, allow_underscores=True)
+        child = zone.child("_dmarc")
+        assert child.is_valid
+        assert child._allow_underscores and child._min_labels == 1
+        with pytest.raises(ValueError):
+            FQDN("example.com").child("_dmarc")
+
+    @pytest.mark.parametrize(
+        "label", ("", "-a", "a-", "a.b", "a b", "a" * 64, "é", None)
+    )
+    def test_child_rejects_invalid_label(self, a_u, label):
+        with pytest.raises(ValueError):
+            FQDN("example.com", allow_underscores=a_u).child(label)
+
+    def test_child_matches_full_validation(self, a_u):
+        name = FQDN("com", allow_underscores=a_u, min_labels=1)
+        for label in ["a" * 63] * 3 + ["b" * 57]:
+            name = name.child(label)
+            assert name.is_valid
+            assert FQDN(name.relative, allow_underscores=a_u).is_valid
+        assert len(name.relative) == 253
+        with pytest.raises(ValueError):
+            name.child("c")
+
+    def test_child_of_invalid(self):
+        with pytest.raises(ValueError):
+            FQDN("example..com").child("www")
+
+    def test_parent(self):
+        name = FQDN("www.example.com.")
+        assert name.parent.absolute == "example.com."
+        assert name.parent.is_valid_absolute
+        assert name.parent is name.parent
+        assert not name.parent.parent.is_valid
+        assert FQDN("com", min_labels=1).parent is None
+        assert FQDN("example.com", min_labels=1).parent.relative == "com"
+        assert FQDN("example.com", min_labels=1).parent.is_valid
+
+    def test_parent_of_invalid(self):
+        with pytest.raises(ValueError):
+            FQDN("www.-example.com").parent
+
+    def test_round_trip(self):
+        name = FQDN("example.com")
+        assert name.child("www").parent == name
+
+    def test_deferred(self):
+        name = FQDN("example.com", defer_validation=True).child("www")
+        assert name._key == "www.example.com."
+        assert name.parent._key == "example.com."
+        assert hash(name) == hash(FQDN("www.example.com"))
+
+
+class TestLabels:
+    def test_labels(self, a_u):
+        name = FQDN("www.BBC.co.uk.", allow_underscores=a_u)
+        assert name.labels == ("www", "bbc", "co", "uk")
+        assert name.labels is name.labels
+        assert name.tld == "uk"
+        assert name.depth == name.labels_count == 4
+        assert FQDN("com", min_labels=1).labels == ("com",)
+
+    def test_invalid(self):
+        name = FQDN("www..bbc.co.uk")
+        for attribute in ("labels", "tld", "depth"):
+            with pytest.raises(ValueError):
+                getattr(name, attribute)
+        assert name.labels_count == 5
+
+    def test_parent_and_child_reuse_labels(self):
+        name = FQDN("www.bbc.co.uk")
+        labels = name.labels
+        parent = name.parent
+        assert "labels" in parent.__dict__
+        assert parent.labels == labels[1:]
+        child = name.child("api")
+        assert child.labels == ("api",) + labels
+        assert child.tld == "uk"
+
+    def test_parent_without_labels(self):
+        name = FQDN("www.bbc.co.uk")
+        parent = name.parent
+        assert "labels" not in parent.__dict__
+        assert parent.labels == ("bbc", "co", "uk")
+
+    def test_invalid_parent_labels(self):
+        name = FQDN("example.com")
+        assert name.labels == ("example", "com")
+        with pytest.raises(ValueError):
+            name.parent.labels
+
+
+class TestCompactFQDN:
+    def test_absolute_and_relative(self, a_u):
+        f = CompactFQDN("TrainWreck.com", allow_underscores=a_u)
+        assert f.absolute == "trainwreck.com."
+        assert f.relative == "trainwreck.com"
+        assert str(f) == "trainwreck.com."
+        assert f.is_valid
+        assert f.labels_count == 2
+
+    def test_invalid_raises(self, a_u):
+        with pytest.raises(ValueError):
+            CompactFQDN("trainwreck..", allow_underscores=a_u)
+        with pytest.raises(ValueError):
+            CompactFQDN("trainwreckcom", allow_underscores=a_u)
+        # bytes are str on Python 2
+        if sys.version_info >= (3, 0):
+            with pytest.raises(ValueError):
+                CompactFQDN(b"trainwreck.com", allow_underscores=a_u)
+
+    def test_options(self):
+        assert CompactFQDN("trainwreckcom", min_labels=1).absolute == "trainwreckcom."
+        assert CompactFQDN("o_o.dog", allow_underscores=True).absolute == "o_o.dog."
+
+    def test_has_no_dict(self):
+        assert not hasattr(CompactFQDN("trainwreck.com"), "__dict__")
+
+    def test_equal_and_hash_to_fqdn(self):
+        compact = CompactFQDN("trainwreck.com")
+        assert compact == CompactFQDN("TRAINWRECK.COM.")
+        assert compact == FQDN("trainwreck.com.")
+        assert FQDN("trainwreck.com.") == compact
+        assert hash(compact) == hash(FQDN("trainwreck.com"))
+        assert compact != CompactFQDN("test.com")
+
+
+class TestInternTable:
+    def test_equal_names_share_one_instance(self):
+        table = InternTable()
+        first = table("trainwreck.com")
+        assert table("TRAINWRECK.COM.") is first
+        assert len(table) == 1
+
+    def test_bounded_least_recently_used(self):
+        table = InternTable(maxsize=2)
+        a = table("a.com")
+        table("b.com")
+        assert table("a.com") is a
+        table("c.com")
+        assert len(table) == 2
+        assert table("a.com") is a
+        assert table("b.com") is not None
+        assert len(table) == 2
+
+    def test_invalid_raises(self):
+        table = InternTable()
+        with pytest.raises(ValueError):
+            table("trainwreckcom")
+        assert len(table) == 0
+
+    def test_options(self):
+        table = InternTable(allow_underscores=True, min_labels=1)
+        assert table("o_o").absolute == "o_o."
+        table.clear()
+        assert len(table) == 0
+
+
+class TestValidationCache:
+    @pytest.fixture
+    def cache(self):
+        cache = fqdn.enable_cache(maxsize=4)
+        yield cache
+        fqdn.disable_cache()
+
+    def test_hits_and_misses(self, cache, a_u):
+        assert FQDN("TrainWreck.com", allow_underscores=a_u).absolute == (
+            "trainwreck.com."
+        )
+        f = FQDN("TrainWreck.com", allow_underscores=a_u)
+        assert f.is_valid
+        assert f.absolute == "trainwreck.com."
+        assert f.relative == "trainwreck.com"
+        assert f.is_valid_relative
+        assert cache.info() == fqdn.CacheInfo(1, 1, 0, 4, 1)
+
+    def test_keyed_on_options(self, cache):
+        assert not FQDN("o_o.dog").is_valid
+        assert FQDN("o_o.dog", allow_underscores=True).is_valid
+        assert not FQDN("o_o.dog", allow_underscores=True, min_labels=3).is_valid
+        assert cache.info().misses == 3
+
+    def test_invalid_names(self, cache):
+        FQDN("trainwreck..")
+        f = FQDN("trainwreck..")
+        assert not f.is_valid
+        with pytest.raises(ValueError):
+            f.absolute
+        assert cache.info().hits == 1
+
+    def test_lru_eviction(self, cache):
+        for name in ("a.com", "b.com", "c.com", "d.com", "a.com", "e.com"):
+            FQDN(name)
+        assert cache.info() == fqdn.CacheInfo(1, 5, 1, 4, 4)
+        FQDN("a.com")
+        FQDN("b.com")
+        assert cache.info() == fqdn.CacheInfo(2, 6, 2, 4, 4)
+
+    def test_fifo_eviction(self):
+        cache = fqdn.enable_cache(maxsize=2, policy="fifo")
+        try:
+            for name in ("a.com", "b.com", "a.com", "c.com", "a.com"):
+                FQDN(name)
+        finally:
+            fqdn.disable_cache()
+        assert cache.info() == fqdn.CacheInfo(1, 4, 2, 2, 2)
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            fqdn.ValidationCache(policy="random")
+
+    def test_disable_and_clear(self, cache):
+        FQDN("a.com")
+        cache.clear()
+        assert cache.info() == fqdn.CacheInfo(0, 0, 0, 4, 0)
+        assert fqdn.disable_cache() is cache
+        FQDN("a.com")
+        assert cache.info().misses == 0
+
+
+class TestStats:
+    @pytest.fixture(autouse=True)
+    def disabled_afterwards(self):
+        yield
+        fqdn.disable_stats()
+
+    def test_counters(self):
+        stats = fqdn.enable_stats()
+        name = FQDN("www.example.com")
+        assert name.is_valid and name.is_valid
+        name.relative
+        assert not FQDN("www..example.com").is_valid
+        assert not FQDN("-.example.com").is_valid
+        counters = stats.snapshot()["counters"]
+        assert counters["constructed"] == 3
+        assert counters["computed.is_valid"] == 3
+        assert counters["hit.is_valid"] >= 1
+        assert counters["computed.relative"] == 1
+        assert counters["rejected.empty_label"] == 1
+        assert counters["rejected.leading_hyphen"] == 1
+        assert stats.snapshot()["timings"] == {}
+
+    def test_disabled_restores_class(self):
+        originals = dict(vars(FQDN))
+        stats = fqdn.enable_stats()
+        name = FQDN("www.example.com")
+        name.is_valid
+        assert fqdn.disable_stats() is stats
+        assert fqdn.disable_stats() is None
+        assert dict(vars(FQDN)) == originals
+        assert name.is_valid and name.absolute == "www.example.com."
+        FQDN("www.example.com").is_valid
+        assert stats.snapshot()["counters"]["constructed"] == 1
+
+    def test_enable_replaces(self):
+        first = fqdn.enable_stats()
+        second = fqdn.enable_stats()
+        FQDN("www.example.com")
+        assert first.snapshot()["counters"] == {}
+        assert second.snapshot()["counters"] == {"constructed": 1}
+
+    def test_sampled_timings(self):
+        stats = fqdn.enable_stats(sample_every=1)
+        FQDN("www.example.com").is_valid
+        timings = stats.snapshot()["timings"]
+        assert sum(timings["construct"].values()) == 1
+        assert sum(timings["is_valid"].values()) == 1
+        for bucket in timings["is_valid"]:
+            assert bucket & (bucket - 1) == 0
+
+    def test_sample_every(self):
+        stats = fqdn.enable_stats(sample_every=3)
+        for _ in range(9):
+            FQDN("www.example.com")
+        assert sum(stats.snapshot()["timings"]["construct"].values()) == 3
+        with pytest.raises(ValueError):
+            fqdn.enable_stats(sample_every=-1)
+
+    def test_with_validation_cache(self):
+        stats = fqdn.enable_stats(sample_every=1)
+        fqdn.enable_cache()
+        try:
+            for name in ("a..b", "a..b", "-a.b", "a.b"):
+                FQDN(name).is_valid
+        finally:
+            fqdn.disable_cache()
+        snapshot = stats.snapshot()
+        counters = snapshot["counters"]
+        assert counters["constructed"] == 4
+        assert counters["computed.is_valid"] == 3
+        assert counters["hit.is_valid"] == 4
+        assert counters["rejected.empty_label"] == 1
+        assert counters["rejected.leading_hyphen"] == 1
+        assert sum(snapshot["timings"]["is_valid"].values()) == 3
+
+    def test_invalid_arguments_keep_stats(self):
+        stats = fqdn.enable_stats()
+        with pytest.raises(ValueError):
+            fqdn.enable_stats(sample_every=-1)
+        FQDN("a.com")
+        assert stats.snapshot()["counters"] == {"constructed": 1}
+
+    def test_callback(self):
+        events = []
+        fqdn.enable_stats(sample_every=1, callback=lambda *event: events.append(event))
+        FQDN("a..b").is_valid
+        metrics = [metric for metric, _ in events]
+        assert metrics[:2] == ["time.construct", "constructed"]
+        assert "computed.is_valid" in metrics
+        assert "time.is_valid" in metrics
+        assert "rejected.empty_label" in metrics
+        assert all(value == 1 for metric, value in events if "time." not in metric)
+
+    def test_clear(self):
+        stats = fqdn.enable_stats(sample_every=1)
+        FQDN("www.example.com")
+        stats.clear()
+        assert stats.snapshot() == {"counters": {}, "timings": {}}
+
+
+class TestBytes:
+    names = TestValidateMany.names
+
+    @pytest.mark.parametrize("wrap", (bytes, bytearray, memoryview))
+    @pytest.mark.parametrize("min_labels", (1, 2, 3))
+    def test_matches_fqdn_is_valid(self, a_u, min_labels, wrap):
+        kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+        for name in self.names:
+            if not str_isascii(name):
+                continue
+            assert fqdn.is_valid_bytes(wrap(name.encode("ascii")), **kwargs) == (
+                FQDN(name, **kwargs).is_valid
+            ), name
+
+    def test_non_ascii_is_invalid(self, a_u):
+        for data in (
+            b"\xc4\xb0.com",  # İ.com
+            b"\xe2\x84\xaa.com",  # KELVIN SIGN
+            b"le-tour-est-jou\xc3\xa9.com",
+        ):
+            assert not fqdn.is_valid_bytes(data, allow_underscores=a_u)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 0), reason="memoryview.cast is Python 3 only"
+    )
+    def test_memoryview_slice_and_format(self):
+        data = memoryview(b"xx trainwreck.com yy")
+        assert fqdn.is_valid_bytes(data[3:17])
+        assert not fqdn.is_valid_bytes(data[3:])
+        assert fqdn.is_valid_bytes(memoryview(bytearray(b"a.com")).cast("c"))
+        assert fqdn.is_valid_bytes(memoryview(b"a.b.").cast("B", (2, 2)))
+        for func in (fqdn.is_valid_bytes, fqdn.absolute_bytes, fqdn.relative_bytes):
+            with pytest.raises(ValueError):
+                func(memoryview(b"aa..ccoomm")[::2])
+
+    @pytest.mark.parametrize("wrap", (bytes, bytearray, memoryview))
+    def test_absolute_and_relative(self, a_u, wrap):
+        for name in (b"TrainWreck.com", b"TrainWreck.com."):
+            assert fqdn.absolute_bytes(wrap(name), allow_underscores=a_u) == (
+                b"trainwreck.com."
+            )
+            assert fqdn.relative_bytes(wrap(name), allow_underscores=a_u) == (
+                b"trainwreck.com"
+            )
+
+    def test_invalid_raises(self, a_u):
+        for func in (fqdn.is_valid_bytes, fqdn.absolute_bytes, fqdn.relative_bytes):
+            with pytest.raises(ValueError):
+                func(b"", allow_underscores=a_u)
+            # str is bytes on Python 2
+            if sys.version_info >= (3, 0):
+                with pytest.raises(ValueError):
+                    func("trainwreck.com", allow_underscores=a_u)
+        with pytest.raises(ValueError):
+            fqdn.absolute_bytes(b"trainwreck..", allow_underscores=a_u)
+        with pytest.raises(ValueError):
+            fqdn.relative_bytes(b"trainwreckcom", allow_underscores=a_u)
+
+
+class TestDeferValidation:
+    def test_hash_and_eq_do_not_validate(self, a_u):
+        f = FQDN("TrainWreck.com", defer_validation=True, allow_underscores=a_u)
+        assert f == FQDN("trainwreck.com.", defer_validation=True)
+        assert hash(f) == hash(FQDN("trainwreck.com.", defer_validation=True))
+        assert "is_valid" not in f.__dict__
+
+    def test_equal_to_validating_mode(self, a_u):
+        deferred = FQDN("trainwreck.com", defer_validation=True, allow_underscores=a_u)
+        validating = FQDN("TRAINWRECK.COM.", allow_underscores=a_u)
+        assert deferred == validating
+        assert validating == deferred
+        assert hash(deferred) == hash(validating)
+        assert deferred == CompactFQDN("trainwreck.com")
+        assert CompactFQDN("trainwreck.com") == deferred
+        assert hash(deferred) == hash(CompactFQDN("trainwreck.com"))
+        assert deferred != FQDN("test.com", defer_validation=True)
+
+    def test_invalid_names_hash_and_validate_on_request(self):
+        f = FQDN("trainwreck..", defer_validation=True)
+        assert {f: 1}[FQDN("TRAINWRECK..", defer_validation=True)] == 1
+        assert not f.is_valid
+        with pytest.raises(ValueError):
+            f.absolute
+        with pytest.raises(ValueError):
+            hash(FQDN("trainwreck.."))
+
+    def test_with_validation_cache(self):
+        fqdn.enable_cache()
+        try:
+            for _ in range(2):
+                f = FQDN("trainwreck.com", defer_validation=True)
+                assert f == FQDN("trainwreck.com")
+        finally:
+            fqdn.disable_cache()
+
+
+class TestImport:
+    def test_import_is_lazy(self):
+        script = (
+            "import sys; before = set(sys.modules); import fqdn; "
+            "print(sorted({'re', 'collections', 'functools'} - before "
+            "& set(sys.modules)))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", script])
+        assert output.strip() == b"[]"
+
+    def test_cache_info_is_a_named_tuple(self):
+        info = fqdn.CacheInfo(1, 2, 3, 4, 5)
+        assert info.currsize == 5
+        assert info == (1, 2, 3, 4, 5)
+        assert repr(info) == (
+            "CacheInfo(hits=1, misses=2, evictions=3, maxsize=4, currsize=5)"
+        )
+        assert fqdn.ValidationCache().info() == (0, 0, 0, 65536, 0)
+        with pytest.raises(AttributeError):
+            fqdn.no_such_attribute
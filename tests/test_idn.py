@@ -0,0 +1,88 @@
+# coding=utf-8
+import pytest
+from fqdn import FQDN
+from fqdn.idn import IDNConverter
+
+NAMES = [
+    "BBC.co.uk",
+    "bbc.co.uk.",
+    "bücher.example",
+    "www.Bücher.example.",
+    "пример.рф",
+    "例え.テスト。",  # ending in an ideographic full stop
+    "\uff21\uff22\uff23.com",  # fullwidth ABC, mapped to abc by nameprep
+    "\u212a.com",  # KELVIN SIGN, mapped to k
+    "o_o.dög",
+    "bücher..example",
+    "xn--bcher-kva.example",
+    "xn--bücher.example",  # an ACE prefix on a U-label
+    "-bücher.example",
+    "ü" * 60 + ".example",  # longer than 63 once encoded
+    "bücher",
+    "。",
+]
+
+
+def codec_then_fqdn(name, relative=False, **kwargs):
+    try:
+        encoded = name.encode("idna").decode("ascii")
+    except UnicodeError:
+        return None
+    f = FQDN(encoded, **kwargs)
+    if not f.is_valid:
+        return None
+    return f.relative if relative else f.absolute
+
+
+@pytest.mark.parametrize("relative", (False, True))
+@pytest.mark.parametrize("a_u", (False, True))
+@pytest.mark.parametrize("min_labels", (1, 2))
+def test_matches_codec_then_fqdn(relative, a_u, min_labels):
+    to_ascii = IDNConverter(
+        relative=relative, allow_underscores=a_u, min_labels=min_labels
+    )
+    kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+    expected = [codec_then_fqdn(name, relative, **kwargs) for name in NAMES]
+    # the second pass takes the A-labels from the cache
+    assert list(to_ascii.map(NAMES)) == expected
+    assert list(to_ascii.map(NAMES)) == expected
+    assert [to_ascii(name) for name in NAMES] == expected
+
+
+def test_examples():
+    to_ascii = IDNConverter()
+    assert to_ascii("www.Bücher.example") == "www.xn--bcher-kva.example."
+    assert to_ascii("例え.テスト。") == "xn--r8jz45g.xn--zckzah."
+    assert to_ascii("bücher..example") is None
+    assert IDNConverter(relative=True)("Bücher.example.") == "xn--bcher-kva.example"
+
+
+def test_only_u_labels_are_cached():
+    to_ascii = IDNConverter()
+    to_ascii("www.bücher.example")
+    to_ascii("shop.bücher.example")
+    to_ascii("xn--bücher.example")
+    assert dict(to_ascii._a_labels) == {
+        "bücher": "xn--bcher-kva",
+        "xn--bücher": None,
+    }
+    to_ascii("bbc.co.uk")
+    assert len(to_ascii) == 2
+    to_ascii.clear()
+    assert len(to_ascii) == 0
+
+
+def test_cache_is_bounded():
+    to_ascii = IDNConverter(maxsize=2)
+    for name in ("ä.example", "ö.example", "ü.example"):
+        to_ascii(name)
+    assert list(to_ascii._a_labels) == ["ö", "ü"]
+
+
+def test_raises_like_constructor():
+    to_ascii = IDNConverter()
+    for name in ("", None, "bücher.example".encode("utf-8")):
+        with pytest.raises(ValueError):
+            to_ascii(name)
+        with pytest.raises(ValueError):
+            list(to_ascii.map(["bbc.co.uk", name]))
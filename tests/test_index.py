@@ -0,0 +1,100 @@
+import pytest
+from fqdn import FQDN, CompactFQDN
+from fqdn.index import SuffixIndex
+
+
+@pytest.fixture
+def zones():
+    return SuffixIndex(["example.com", "ADS.example.net.", "deep.a.b.example.org"])
+
+
+def test_exact_lookup(zones):
+    assert "example.com" in zones
+    assert "EXAMPLE.COM." in zones
+    assert FQDN("ads.example.net") in zones
+    assert CompactFQDN("ads.example.net") in zones
+    assert "www.example.com" not in zones
+    assert "com" not in zones
+    assert len(zones) == 3
+
+
+def test_longest_match(zones):
+    assert zones.longest_match("example.com") == "example.com."
+    assert zones.longest_match("www.EXAMPLE.com.") == "example.com."
+    assert zones.longest_match("x.y.ads.example.net") == "ads.example.net."
+    assert zones.longest_match("example.net") is None
+    assert zones.longest_match("a.b.example.org") is None
+    assert zones.longest_match("notexample.com") is None
+
+
+def test_longest_of_nested_zones(zones):
+    zones.add("www.example.com")
+    assert zones.longest_match("a.www.example.com") == "www.example.com."
+    assert zones.longest_match("a.mail.example.com") == "example.com."
+
+
+def test_values(zones):
+    zones["example.com"] = "allow"
+    zones.add("ads.example.net", "deny")
+    assert zones["EXAMPLE.com"] == "allow"
+    assert zones.get("missing.com") is None
+    assert zones.longest_match_item("x.ads.example.net") == ("ads.example.net.", "deny")
+    assert zones.longest_match_item("example.net", "none") == "none"
+
+
+def test_remove(zones):
+    zones.discard("example.com")
+    zones.discard("example.com")
+    del zones["ads.example.net"]
+    with pytest.raises(KeyError):
+        del zones["ads.example.net"]
+    assert list(zones) == ["deep.a.b.example.org."]
+
+
+def test_invalid_names_are_rejected():
+    zones = SuffixIndex()
+    with pytest.raises(ValueError):
+        zones.add("trainwreck..")
+    with pytest.raises(ValueError):
+        zones.add("com")
+    with pytest.raises(ValueError):
+        zones.update(["a.com", ""])
+    with pytest.raises(ValueError):
+        _ = "" in zones
+
+
+def test_invalid_name_leaves_index_unchanged(zones):
+    zones.add("example.com", "allow")
+    before = {name: zones[name] for name in zones}
+    with pytest.raises(ValueError):
+        zones.update(["new.example.com", "other.example.com", "trainwreck.."])
+    assert {name: zones[name] for name in zones} == before
+    assert "new.example.com" not in zones
+
+
+def test_fqdn_inputs_are_validated_with_the_index_options():
+    zones = SuffixIndex()
+    for name in (
+        FQDN("_dmarc.example.com", allow_underscores=True),
+        CompactFQDN("_dmarc.example.com", allow_underscores=True),
+        FQDN("localhost", min_labels=1),
+        CompactFQDN("localhost", min_labels=1),
+    ):
+        with pytest.raises(ValueError):
+            zones.add(name)
+        with pytest.raises(ValueError):
+            zones.update([name])
+    assert len(zones) == 0
+    zones.add(FQDN("example.com"))
+    assert "example.com" in zones
+    with pytest.raises(ValueError):
+        zones.add(FQDN("trainwreck.."))
+    underscores = SuffixIndex(allow_underscores=True)
+    underscores.add(FQDN("_dmarc.example.com", allow_underscores=True))
+    assert "_dmarc.example.com" in underscores
+
+
+def test_options():
+    zones = SuffixIndex(["com", "o_o.dog"], allow_underscores=True, min_labels=1)
+    assert zones.longest_match("example.com") == "com."
+    assert zones.longest_match("x.o_o.dog") == "o_o.dog."
@@ -0,0 +1,80 @@
+import io
+import sys
+
+import pytest
+from fqdn.__main__ import main, run
+
+NAMES = b"www.Example.com\nbad..name\n\no_o.dog\r\nfoo.bar.\nlabel"
+
+
+def run_bytes(data, **kwargs):
+    output = io.BytesIO()
+    counts = run([io.BytesIO(data)], output, **kwargs)
+    return output.getvalue().decode("utf-8").splitlines(), counts
+
+
+def test_default_output():
+    lines, counts = run_bytes(NAMES)
+    assert lines == [
+        "www.Example.com\tvalid",
+        "bad..name\tinvalid",
+        "\tinvalid",
+        "o_o.dog\tinvalid",
+        "foo.bar.\tvalid",
+        "label\tinvalid",
+    ]
+    assert counts == (2, 4)
+
+
+def test_valid_absolute():
+    lines, _ = run_bytes(NAMES, normalize="absolute", select="valid")
+    assert lines == ["www.example.com.", "foo.bar."]
+
+
+def test_valid_relative_with_options():
+    lines, counts = run_bytes(
+        NAMES,
+        normalize="relative",
+        select="valid",
+        allow_underscores=True,
+        min_labels=1,
+    )
+    assert lines == ["www.example.com", "o_o.dog", "foo.bar", "label"]
+    assert counts == (4, 2)
+
+
+def test_invalid_only_is_not_normalized():
+    lines, _ = run_bytes(NAMES, normalize="absolute", select="invalid")
+    assert lines == ["bad..name", "", "o_o.dog", "label"]
+
+
+def test_non_utf8_is_passed_through():
+    output = io.BytesIO()
+    run([io.BytesIO(b"\xff.com\n")], output, select="invalid")
+    assert output.getvalue() == b"\xff.com\n"
+
+
+def test_main_files_and_stats(tmp_path, capsysbinary):
+    path = tmp_path / "names.txt"
+    path.write_bytes(NAMES)
+    assert main(["--valid", "--stats", str(path), str(path)]) == 0
+    out, err = capsysbinary.readouterr()
+    assert out.splitlines() == [b"www.Example.com", b"foo.bar."] * 2
+    assert err.startswith(b"12 lines, 4 valid, 8 invalid in ")
+    assert b"lines/s" in err
+
+
+def test_main_stdin(monkeypatch, capsysbinary):
+    stdin = io.TextIOWrapper(io.BytesIO(b"a.com\n"))
+    monkeypatch.setattr(sys, "stdin", stdin)
+    assert main(["--absolute"]) == 0
+    assert capsysbinary.readouterr()[0] == b"a.com.\tvalid\n"
+
+
+def test_main_missing_file(tmp_path, capsys):
+    assert main([str(tmp_path / "missing")]) == 2
+
+
+def test_conflicting_options():
+    with pytest.raises(SystemExit):
+        main(["--valid", "--invalid"])
@@ -0,0 +1,83 @@
+import sys
+
+import pytest
+from fqdn import FQDN
+from fqdn.normalize import Normalizer
+
+NAMES = [
+    "BBC.co.uk",
+    "bbc.co.uk.",
+    "bbc.co.uk",
+    "bbc..co.uk",
+    "www.BBC.co.uk",
+    "o_o.dog",
+    "label",
+    "\u212a.com",  # KELVIN SIGN, lowercased to k
+    "k.com.",
+]
+
+
+def canonical(name, relative=False, **kwargs):
+    f = FQDN(name, **kwargs)
+    if not f.is_valid:
+        return None
+    return f.relative if relative else f.absolute
+
+
+@pytest.mark.parametrize("relative", (False, True))
+@pytest.mark.parametrize("a_u", (False, True))
+@pytest.mark.parametrize("min_labels", (1, 2))
+def test_matches_fqdn(relative, a_u, min_labels):
+    normalize = Normalizer(
+        relative=relative, allow_underscores=a_u, min_labels=min_labels
+    )
+    kwargs = {"allow_underscores": a_u, "min_labels": min_labels}
+    expected = [canonical(name, relative, **kwargs) for name in NAMES]
+    # the second pass is answered from the memo
+    assert list(normalize.map(NAMES)) == expected
+    assert list(normalize.map(NAMES)) == expected
+    assert [normalize(name) for name in NAMES] == expected
+
+
+def test_memo_is_bounded():
+    normalize = Normalizer(maxsize=2)
+    for name in NAMES:
+        normalize(name)
+    assert len(normalize) == 2
+    assert list(normalize._memo) == NAMES[-2:]
+
+
+def test_unique():
+    normalize = Normalizer()
+    assert list(normalize.unique(NAMES)) == ["bbc.co.uk.", "www.bbc.co.uk.", "k.com."]
+    # remembered across calls
+    assert list(normalize.unique(["BBC.CO.UK", "new.example"])) == ["new.example."]
+    normalize.clear()
+    assert len(normalize) == 0
+    assert list(normalize.unique(["BBC.CO.UK"])) == ["bbc.co.uk."]
+
+
+def test_unique_relative():
+    normalize = Normalizer(relative=True)
+    assert list(normalize.unique(["a.com", "A.COM."])) == ["a.com"]
+
+
+def test_seen_set_is_bounded():
+    normalize = Normalizer(seen_maxsize=2)
+    names = ["a.com", "b.com", "a.com", "c.com", "a.com", "b.com"]
+    # a.com stays as it keeps appearing; b.com is forgotten and emitted again
+    assert list(normalize.unique(names)) == ["a.com.", "b.com.", "c.com.", "b.com."]
+    assert len(normalize._seen) == 2
+
+
+def test_raises_like_constructor():
+    normalize = Normalizer()
+    names = ["", None]
+    if sys.version_info >= (3, 0):
+        # bytes are str on Python 2
+        names.append(b"bbc.co.uk")
+    for name in names:
+        with pytest.raises(ValueError):
+            normalize(name)
+        with pytest.raises(ValueError):
+            list(normalize.map(["bbc.co.uk", name]))
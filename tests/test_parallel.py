@@ -0,0 +1,81 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from fqdn import validate_many
+from fqdn.parallel import validate_parallel
+
+NAMES = ["host{0}.example.com".format(i) for i in range(50)] + [
+    "trainwreck..",
+    "o_o.dog",
+    "label",
+    "-a.com",
+] * 10
+
+
+def flatten(chunks):
+    results = bytearray()
+    expected_offset = 0
+    for offset, chunk in chunks:
+        assert offset == expected_offset
+        results += chunk
+        expected_offset += len(chunk)
+    return results
+
+
+def test_ordered_matches_validate_many():
+    chunks = validate_parallel(NAMES, workers=2, chunksize=7)
+    assert flatten(chunks) == validate_many(NAMES)
+
+
+def test_options():
+    chunks = validate_parallel(
+        iter(NAMES), allow_underscores=True, min_labels=1, workers=2, chunksize=16
+    )
+    assert flatten(chunks) == validate_many(NAMES, allow_underscores=True, min_labels=1)
+
+
+def test_unordered_covers_every_chunk():
+    chunks = sorted(validate_parallel(NAMES, workers=2, chunksize=9, ordered=False))
+    assert flatten(chunks) == validate_many(NAMES)
+
+
+def test_shared_executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for _ in range(2):
+            chunks = validate_parallel(NAMES, chunksize=32, executor=executor)
+            assert flatten(chunks) == validate_many(NAMES)
+
+
+def test_empty_input():
+    assert list(validate_parallel([], workers=1)) == []
+
+
+def test_errors_propagate():
+    with pytest.raises(ValueError):
+        list(validate_parallel(["a.com", None], workers=1, chunksize=1))
+    with pytest.raises(ValueError):
+        validate_parallel(NAMES, chunksize=0)
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self, max_workers):
+        super().__init__(max_workers=max_workers)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.parametrize("workers, in_flight", ((None, 4), (1, 1)))
+def test_in_flight_limit(workers, in_flight, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    with RecordingExecutor(max_workers=3) as executor:
+        chunks = validate_parallel(
+            NAMES, workers=workers, chunksize=1, executor=executor
+        )
+        next(chunks)
+        # two chunks per worker, and one more once the first has finished
+        assert executor.submitted == 2 * in_flight + 1
+        chunks.close()
@@ -0,0 +1,203 @@
+# coding=utf-8
+import json
+import os
+import sys
+
+import pytest
+from fqdn import FQDN
+from fqdn._compat import str_isascii
+from fqdn.psl import PublicSuffixList
+
+LIST = u"""
+// ===BEGIN ICANN DOMAINS===
+com
+// jp
+jp
+ac.jp
+kyoto.jp
+ide.kyoto.jp
+*.kobe.jp
+!city.kobe.jp
+// mm
+*.mm
+// ck
+*.ck
+!www.ck
+// us
+us
+ak.us
+k12.ak.us
+// cn
+cn
+com.cn
+公司.cn
+中国
+// ===END ICANN DOMAINS===
+// ===BEGIN PRIVATE DOMAINS===
+uk.com  // trailing text is ignored
+// ===END PRIVATE DOMAINS===
+"""
+
+# from the Public Suffix List's test vectors, with null as None
+VECTORS = [
+    ("COM", None),
+    ("example.COM", "example.com"),
+    ("WwW.example.COM", "example.com"),
+    ("example.com", "example.com"),
+    ("a.example.com", "example.com"),
+    ("uk.com", None),
+    ("example.uk.com", "example.uk.com"),
+    ("b.example.uk.com", "example.uk.com"),
+    ("a.b.example.uk.com", "example.uk.com"),
+    ("test.ac", "test.ac"),
+    ("mm", None),
+    ("c.mm", None),
+    ("b.c.mm", "b.c.mm"),
+    ("a.b.c.mm", "b.c.mm"),
+    ("jp", None),
+    ("test.jp", "test.jp"),
+    ("www.test.jp", "test.jp"),
+    ("ac.jp", None),
+    ("test.ac.jp", "test.ac.jp"),
+    ("www.test.ac.jp", "test.ac.jp"),
+    ("kyoto.jp", None),
+    ("test.kyoto.jp", "test.kyoto.jp"),
+    ("ide.kyoto.jp", None),
+    ("b.ide.kyoto.jp", "b.ide.kyoto.jp"),
+    ("a.b.ide.kyoto.jp", "b.ide.kyoto.jp"),
+    ("c.kobe.jp", None),
+    ("b.c.kobe.jp", "b.c.kobe.jp"),
+    ("a.b.c.kobe.jp", "b.c.kobe.jp"),
+    ("city.kobe.jp", "city.kobe.jp"),
+    ("www.city.kobe.jp", "city.kobe.jp"),
+    ("ck", None),
+    ("test.ck", None),
+    ("b.test.ck", "b.test.ck"),
+    ("a.b.test.ck", "b.test.ck"),
+    ("www.ck", "www.ck"),
+    ("www.www.ck", "www.ck"),
+    ("us", None),
+    ("test.us", "test.us"),
+    ("www.test.us", "test.us"),
+    ("ak.us", None),
+    ("test.ak.us", "test.ak.us"),
+    ("www.test.ak.us", "test.ak.us"),
+    ("k12.ak.us", None),
+    ("test.k12.ak.us", "test.k12.ak.us"),
+    ("www.test.k12.ak.us", "test.k12.ak.us"),
+    ("食狮.com.cn", "食狮.com.cn"),
+    ("食狮.公司.cn", "食狮.公司.cn"),
+    ("www.食狮.公司.cn", "食狮.公司.cn"),
+    ("shishi.公司.cn", "shishi.公司.cn"),
+    ("公司.cn", None),
+    ("食狮.中国", "食狮.中国"),
+    ("www.食狮.中国", "食狮.中国"),
+    ("shishi.中国", "shishi.中国"),
+    ("中国", None),
+    ("xn--85x722f.com.cn", "xn--85x722f.com.cn"),
+    ("xn--85x722f.xn--55qx5d.cn", "xn--85x722f.xn--55qx5d.cn"),
+    ("www.xn--85x722f.xn--55qx5d.cn", "xn--85x722f.xn--55qx5d.cn"),
+    ("shishi.xn--55qx5d.cn", "shishi.xn--55qx5d.cn"),
+    ("xn--55qx5d.cn", None),
+    ("xn--85x722f.xn--fiqs8s", "xn--85x722f.xn--fiqs8s"),
+    ("www.xn--85x722f.xn--fiqs8s", "xn--85x722f.xn--fiqs8s"),
+    ("shishi.xn--fiqs8s", "shishi.xn--fiqs8s"),
+    ("xn--fiqs8s", None),
+]
+if sys.version_info < (3, 0):
+    # names are bytes on Python 2, which only match rules in ASCII form
+    VECTORS = [vector for vector in VECTORS if str_isascii(vector[0])]
+
+SYSTEM_LIST = "/usr/share/publicsuffix/public_suffix_list.dat"
+
+
+@pytest.fixture(scope="module")
+def psl():
+    return PublicSuffixList(LIST.splitlines())
+
+
+@pytest.mark.parametrize("name,expected", VECTORS)
+def test_vectors(psl, name, expected):
+    assert psl.registrable_domain(name) == expected
+    suffix, registrable = psl.split(name)
+    assert registrable == expected
+    assert suffix == psl.public_suffix(name)
+    if expected is not None:
+        assert expected.endswith("." + suffix)
+        assert expected.count(".") == suffix.count(".") + 1
+
+
+def test_forms(psl):
+    assert psl.public_suffix("www.Example.com.") == "com"
+    assert psl.split(FQDN("www.example.uk.com.")) == ("uk.com", "example.uk.com")
+    assert psl.public_suffix("unlisted") == "unlisted"
+    assert psl.public_suffix("a.unlisted") == "unlisted"
+    with pytest.raises(ValueError):
+        psl.public_suffix(FQDN("a..com"))
+    with pytest.raises(ValueError):
+        psl.public_suffix("")
+
+
+def test_private(psl):
+    icann = PublicSuffixList(LIST.splitlines(), private=False)
+    assert icann.registrable_domain("b.example.uk.com") == "uk.com"
+    assert len(icann) < len(psl)
+
+
+def test_bulk(psl):
+    names = [name for name, _ in VECTORS] * 2 + [FQDN("www.example.com")]
+    expected = [domain for _, domain in VECTORS] * 2 + ["example.com"]
+    assert psl.registrable_domains(iter(names)) == expected
+
+
+def test_cache(tmp_path):
+    path = tmp_path / "list.dat"
+    path.write_text(LIST, encoding="utf-8")
+    cache = str(tmp_path / "list.json")
+    parsed = PublicSuffixList.from_file(str(path), cache=cache)
+    assert os.path.exists(cache)
+    cached = PublicSuffixList.from_file(str(path), cache=cache)
+    assert cached._index == parsed._index
+    # a cache for other options or another version of the list is ignored
+    icann = PublicSuffixList.from_file(str(path), private=False, cache=cache)
+    assert icann.registrable_domain("b.example.uk.com") == "uk.com"
+    path.write_text(LIST + "\nexample.com\n", encoding="utf-8")
+    updated = PublicSuffixList.from_file(str(path), cache=cache)
+    assert updated.registrable_domain("example.com") is None
+    # as is a corrupt one
+    with open(cache, "wb") as f:
+        f.write(b"not json")
+    cached = PublicSuffixList.from_file(str(path), cache=cache)
+    assert cached._index == updated._index
+
+
+def test_cache_is_best_effort(tmp_path):
+    path = tmp_path / "list.dat"
+    path.write_text(LIST, encoding="utf-8")
+    expected = PublicSuffixList.from_file(str(path))._index
+    # a cache that cannot be written
+    cache = str(tmp_path / "missing" / "list.json")
+    assert PublicSuffixList.from_file(str(path), cache=cache)._index == expected
+    assert not (tmp_path / "missing").exists()
+    # a directory in the way of the rename leaves no temporary file behind
+    (tmp_path / "dir.json").mkdir()
+    cache = str(tmp_path / "dir.json")
+    assert PublicSuffixList.from_file(str(path), cache=cache)._index == expected
+    assert sorted(os.listdir(str(tmp_path))) == ["dir.json", "list.dat"]
+    # JSON of another shape, or with the current key but flags of another type
+    cache = str(tmp_path / "list.json")
+    PublicSuffixList.from_file(str(path), cache=cache)
+    with open(cache) as f:
+        key = json.load(f)[0]
+    for other in (None, [1, 2, 3], ["key", "index"], 42, {"a": 1}, [key, {"a": "1"}]):
+        with open(cache, "w") as f:
+            json.dump(other, f)
+        assert PublicSuffixList.from_file(str(path), cache=cache)._index == expected
+
+
+@pytest.mark.skipif(not os.path.exists(SYSTEM_LIST), reason="no system list")
+def test_system_list():
+    psl = PublicSuffixList.from_file(SYSTEM_LIST)
+    assert psl.split("www.bbc.co.uk") == ("co.uk", "bbc.co.uk")
+    assert psl.registrable_domain("foo.github.io") == "foo.github.io"
+    assert psl.registrable_domain("www.example.com") == "example.com"
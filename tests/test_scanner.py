@@ -0,0 +1,80 @@
+# coding=utf-8
+"""
+Differential tests: the scanner engine must agree with the regex engine.
+"""
+import random
+
+import pytest
+from fqdn import _regex_is_valid, _scanner
+
+ALPHABET = "abcXYZ019-._\n é٣"
+
+
+@pytest.fixture(params=(True, False))
+def a_u(request):
+    return request.param
+
+
+@pytest.fixture(params=(0, 1, 2, 3))
+def min_labels(request):
+    return request.param
+
+
+def random_names(seed, count=3000):
+    rng = random.Random(seed)
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.6:
+            # short names drawn from a small alphabet hit the label edge
+            # cases, hyphens and dots next to each other, often
+            yield "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 12)))
+        else:
+            # longer names around the label and total length limits
+            labels = [
+                "".join(rng.choice("ab-_") for _ in range(rng.randint(0, 66)))
+                for _ in range(rng.randint(1, 8))
+            ]
+            yield ".".join(labels) + rng.choice(("", ".", ".."))
+
+
+def long_names():
+    for count in (126, 127, 128):
+        for label in ("a", "b-c", "-a", "a-"):
+            name = ".".join([label] * count)
+            yield name
+            yield name + "."
+    for size in (62, 63, 64):
+        yield "a" * size + ".com"
+        yield "com." + "b" * size
+    yield ".".join(["a" * 63] * 4)
+    yield ".".join(["a" * 63] * 3 + ["a" * 61])
+    yield ".".join(["a" * 63] * 3 + ["a" * 61]) + "."
+    yield ".".join(["a" * 63] * 3 + ["a" * 62])
+
+
+def assert_same(names, allow_underscores, min_labels):
+    for name in names:
+        expected = _regex_is_valid(name, allow_underscores, min_labels)
+        assert _scanner.is_valid(name, allow_underscores, min_labels) == (
+            expected
+        ), name
+        result = _scanner.check(name, allow_underscores, min_labels)
+        assert bool(result) == expected, name
+        if expected:
+            assert result is _scanner.VALID
+        else:
+            assert 0 <= result.offset <= len(name), (name, result)
+            assert result.label <= name.count(".") + 1, (name, result)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_names(seed, a_u, min_labels):
+    assert_same(random_names(seed), a_u, min_labels)
+
+
+def test_long_names(a_u, min_labels):
+    assert_same(long_names(), a_u, min_labels)
+
+
+def test_degenerate_names(a_u, min_labels):
+    assert_same(["", ".", "..", "-", "-.", ".-", "a", "a.", ".a"], a_u, min_labels)